@@ -15,17 +15,20 @@ CORRECTED VERSION (Feb 17, 2026) — All audit findings resolved:
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from io import StringIO
+from dataclasses import dataclass
+from functools import partial
+from datetime import datetime
 import json
+import re
 from pathlib import Path
-import pickle
 
+from helpers.cibc_loader import load_cibc_csv
+from helpers.gst_calculator import GST_FRACTION
 from helpers.transaction_classifier import TransactionClassifier
-from helpers.gst_calculator import GSTCalculator
 from helpers.shareholder_tracker import ShareholderTracker
-from helpers.report_generator import ReportGenerator
+from helpers.revenue_simple import label_revenue_source
 
 st.set_page_config(
     page_title="CRA-Ready Books - Cape Bretoner's Oilfield",
@@ -57,8 +60,8 @@ def seed_data_if_needed(year_dir: Path):
             shutil.copy2(seed_file, target)
 
 if 'fiscal_year' not in st.session_state:
-    current_month = datetime.now().month
-    current_year = datetime.now().year
+    today = datetime.now()
+    current_month, current_year = today.month, today.year
     if current_month >= 12:
         fy_start = current_year
         fy_end = current_year + 1
@@ -81,18 +84,85 @@ def load_json(filename, default):
     return default
 
 def save_json(filename, data):
-    with open(get_year_data_dir() / filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Write beside the target and swap it in, so a crash mid-write never
+    # leaves a truncated file behind
+    path = get_year_data_dir() / filename
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(data, indent=2))
+    tmp.replace(path)
 
 def load_dataframe(filename):
     path = get_year_data_dir() / filename
     if path.exists():
-        return pd.read_pickle(path)
+        return pd.read_feather(path)
+    # Frames saved before the switch to Feather were pickled
+    legacy_path = path.with_suffix('.pkl')
+    if legacy_path.exists():
+        return pd.read_pickle(legacy_path)
     return None
 
 def save_dataframe(filename, df):
     if df is not None:
-        df.to_pickle(get_year_data_dir() / filename)
+        # Feather only stores a default index; row labels carry no meaning once saved
+        df.reset_index(drop=True).to_feather(get_year_data_dir() / filename)
+
+def normalize_classified(df):
+    """Give frames pickled before cra_category became categorical the same dtypes as fresh ones.
+
+    Saved statements can carry categories the classifier never emits (e.g. 'Revenue'
+    from the CSV export), so the categories are the classifier's plus whatever is present.
+    """
+    if df is None or 'cra_category' not in df.columns:
+        return df
+    if not isinstance(df['cra_category'].dtype, pd.CategoricalDtype):
+        present = df['cra_category'].dropna().unique().tolist()
+        categories = list(dict.fromkeys(list(TransactionClassifier.CATEGORY_DTYPE.categories) + present))
+        df['cra_category'] = df['cra_category'].astype(pd.CategoricalDtype(categories))
+    for col in ['is_personal', 'needs_review']:
+        if col in df.columns and df[col].dtype != bool and df[col].isin([True, False]).all():
+            df[col] = df[col].astype(bool)
+    # Text held as Python objects costs ~50 bytes per cell; Arrow keeps it in one buffer.
+    # Fresh classifier output has object or default-str columns, saved frames may have either
+    for col in ['date', 'description', 'notes']:
+        if col in df.columns and df[col].dtype != 'string[pyarrow]' and (
+                df[col].dtype == object or pd.api.types.is_string_dtype(df[col].dtype)):
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+def stamp_fingerprint(df):
+    """Hash the classified frame once so cache lookups don't rehash it every rerun."""
+    if df is not None:
+        df.attrs['fingerprint'] = int(pd.util.hash_pandas_object(df, index=False).sum())
+    return df
+
+# Categories offered when entering a cash expense
+CASH_CATEGORIES = (
+    'Fuel & Petroleum', 'Vehicle Repairs & Maintenance', 'Equipment & Supplies',
+    'Meals & Entertainment (50%)', 'Office Expenses', 'Other Business Expense',
+)
+
+def set_cash_expenses(expenses):
+    """Store cash expenses plus a parallel float64 array of their amounts and its total."""
+    st.session_state.cash_expenses = expenses
+    st.session_state.cash_amounts = np.array([e['amount'] for e in expenses], dtype=np.float64)
+    st.session_state.cash_total = float(st.session_state.cash_amounts.sum())
+
+def add_cash_expense(expense):
+    st.session_state.cash_expenses.append(expense)
+    st.session_state.cash_amounts = np.append(st.session_state.cash_amounts, float(expense['amount']))
+    # Totals are only recomputed when the list changes, not on every page view
+    st.session_state.cash_total = float(st.session_state.cash_amounts.sum())
+
+def load_phone_bill():
+    """Load the per-person phone bill, building the default only when there is no usable file."""
+    phone_data = load_json('phone_bill.json', None)
+    # Files from before the per-person split have a top-level 'monthly' key
+    if phone_data is None or 'monthly' in phone_data:
+        phone_data = {
+            'greg': {'monthly': 0.0, 'business_pct': 100},
+            'lilibeth': {'monthly': 0.0, 'business_pct': 100}
+        }
+    return phone_data
 
 def get_available_years():
     if not BASE_DATA_DIR.exists():
@@ -114,18 +184,17 @@ selected_year = st.sidebar.selectbox("📅 Fiscal Year", available_years, index=
 
 if selected_year != st.session_state.fiscal_year:
     st.session_state.fiscal_year = selected_year
-    st.session_state.corporate_df = load_dataframe('corporate_df.pkl')
-    st.session_state.classified_df = load_dataframe('classified_df.pkl')
-    st.session_state.cash_expenses = load_json('cash_expenses.json', [])
-    st.session_state.phone_bill = load_json('phone_bill.json', {
-        'greg': {'monthly': 0.0, 'business_pct': 100},
-        'lilibeth': {'monthly': 0.0, 'business_pct': 100}
-    })
+    st.session_state.classified_df = stamp_fingerprint(normalize_classified(load_dataframe('classified_df.feather')))
+    set_cash_expenses(load_json('cash_expenses.json', []))
+    st.session_state.phone_bill = load_phone_bill()
     st.session_state.missing_receipts = load_json('missing_receipts.json', [])
-    st.rerun()
+    # Nothing above this point depends on the year's data, so the run carries on
+    # with the new year instead of restarting via st.rerun()
 
-fy_start, fy_end = st.session_state.fiscal_year.split('-')
-st.sidebar.markdown(f"**Active:** FY {st.session_state.fiscal_year}")
+# Bound once per run; page code reads the local instead of going through the session proxy
+fiscal_year = st.session_state.fiscal_year
+fy_start, fy_end = fiscal_year.split('-')
+st.sidebar.markdown(f"**Active:** FY {fiscal_year}")
 st.sidebar.markdown(f"Dec 1, {fy_start} → Nov 30, {fy_end}")
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Ownership")
@@ -133,20 +202,12 @@ st.sidebar.markdown("👨 **Greg:** 51%")
 st.sidebar.markdown("👩 **Lilibeth:** 49%")
 
 # Session state initialization
-if 'corporate_df' not in st.session_state:
-    st.session_state.corporate_df = load_dataframe('corporate_df.pkl')
 if 'classified_df' not in st.session_state:
-    st.session_state.classified_df = load_dataframe('classified_df.pkl')
-if 'cash_expenses' not in st.session_state:
-    st.session_state.cash_expenses = load_json('cash_expenses.json', [])
+    st.session_state.classified_df = stamp_fingerprint(normalize_classified(load_dataframe('classified_df.feather')))
+if 'cash_total' not in st.session_state:
+    set_cash_expenses(load_json('cash_expenses.json', []))
 if 'phone_bill' not in st.session_state:
-    phone_data = load_json('phone_bill.json', {
-        'greg': {'monthly': 0.0, 'business_pct': 100},
-        'lilibeth': {'monthly': 0.0, 'business_pct': 100}
-    })
-    if 'monthly' in phone_data:
-        phone_data = {'greg': {'monthly': 0.0, 'business_pct': 100}, 'lilibeth': {'monthly': 0.0, 'business_pct': 100}}
-    st.session_state.phone_bill = phone_data
+    st.session_state.phone_bill = load_phone_bill()
 if 'shareholder_tracker' not in st.session_state:
     st.session_state.shareholder_tracker = ShareholderTracker()
 if 'missing_receipts' not in st.session_state:
@@ -159,32 +220,6 @@ page = st.sidebar.radio("Navigation", [
 ])
 
 
-# ============================================================
-# HELPER: CIBC CSV LOADER
-# ============================================================
-def load_cibc_csv(content):
-    lines = content.strip().split('\n')
-    data = []
-    seen = set()
-    for line in lines:
-        if not line.strip():
-            continue
-        parts = line.split(',')
-        if len(parts) >= 3:
-            try:
-                date = pd.to_datetime(parts[0].strip()).strftime('%Y-%m-%d')
-                desc = parts[1].strip()
-                debit = float(parts[2].strip()) if parts[2].strip() else 0
-                credit = float(parts[3].strip()) if len(parts) > 3 and parts[3].strip() else 0
-                key = (date, desc, debit, credit)
-                if key not in seen:
-                    seen.add(key)
-                    data.append({'date': date, 'description': desc, 'debit': debit, 'credit': credit})
-            except:
-                continue
-    return pd.DataFrame(data)
-
-
 # ============================================================
 # HELPER: Get clean deduplicated df
 # ============================================================
@@ -192,25 +227,34 @@ def get_clean_df():
     """Return deduplicated classified dataframe or None."""
     if st.session_state.classified_df is None:
         return None
-    df = st.session_state.classified_df.copy()
-    df = df.drop_duplicates(subset=['date', 'description', 'debit', 'credit'], keep='first')
-    return df
+    return dedupe_transactions(st.session_state.classified_df)
 
 
 # ============================================================
 # HELPER: Taxable revenue only (FIX #2)
 # ============================================================
+# The category name in the CSV export is 'Revenue' but in the classifier it's
+# 'Revenue - Oilfield Services'. Handle both.
+REVENUE_CATEGORIES = ['Revenue', 'Revenue - Oilfield Services']
+# Revenue page buckets, first match wins: wire, then mobile, then any other deposit
+REVENUE_SOURCE_PATTERN = re.compile(
+    r'^(?:.*?(?P<wire>WIRE TSF)|.*?(?P<mobile>MOBILE DEPOSIT)|.*?(?P<branch>BRANCH|DEPOSIT))',
+    re.IGNORECASE | re.DOTALL
+)
+REVENUE_SOURCE_LABELS = (
+    ('wire', 'Wire Transfers'), ('mobile', 'Mobile Deposits'),
+    ('branch', 'Branch Deposits'), ('other', 'Other'),
+)
+
+
 def get_taxable_revenue(df):
     """Return only confirmed taxable oilfield revenue credits.
     
     This is the CORRECTED version that excludes non-revenue credits
     like SHL repayments, reversals, and miscoded deposits.
     """
-    # The category name in the CSV export is 'Revenue' but in the classifier it's 
-    # 'Revenue - Oilfield Services'. Handle both.
-    revenue_categories = ['Revenue', 'Revenue - Oilfield Services']
-    mask = df['cra_category'].isin(revenue_categories) & (df['credit'] > 0)
-    return df.loc[mask, 'credit'].sum()
+    credit = df['credit'].to_numpy(dtype=float)
+    return credit[df['cra_category'].isin(REVENUE_CATEGORIES).to_numpy() & (credit > 0)].sum()
 
 
 # ============================================================
@@ -222,41 +266,259 @@ def calc_gst_collected(taxable_revenue):
     Client wire transfers include GST. To extract:
     GST = Revenue × 5 ÷ 105 (NOT Revenue × 5%)
     """
-    return taxable_revenue * 0.05 / 1.05
+    return taxable_revenue * GST_FRACTION
+
+
+# ============================================================
+# HELPER: Phone bill ITCs
+# ============================================================
+PHONE_OWNERS = ('greg', 'lilibeth')
+PHONE_COLUMN_CONFIG = {'Monthly Bill ($)': st.column_config.NumberColumn(min_value=0.0, format='$%.2f')}
+
+
+def calc_phone_itc(phone_bill):
+    """Annual cost, deductible share and ITC per phone owner, as arrays in PHONE_OWNERS order."""
+    monthly = np.array([phone_bill.get(owner, {}).get('monthly', 0.0) for owner in PHONE_OWNERS], dtype=float)
+    pct = np.array([phone_bill.get(owner, {}).get('business_pct', 100) for owner in PHONE_OWNERS], dtype=float)
+    annual = monthly * 12
+    deductible = annual * pct / 100
+    return {'annual': annual, 'deductible': deductible, 'itc': deductible * GST_FRACTION}
+
+
+# ============================================================
+# HELPER: Cached aggregates (Streamlit reruns the script on every widget change)
+# ============================================================
+def _df_fingerprint(df):
+    """cache_data key for a DataFrame: the stamped hash, guarded by the row labels and columns.
+
+    attrs follow copies and slices, so the ordered index hash keeps filtered or
+    re-sorted views of the stamped frame from colliding with it or with each
+    other. Unstamped frames are hashed in full.
+    """
+    fingerprint = df.attrs.get('fingerprint')
+    if fingerprint is None:
+        return (hash(pd.util.hash_pandas_object(df).to_numpy().tobytes()), tuple(df.columns))
+    return (fingerprint, hash(pd.util.hash_array(df.index.to_numpy()).tobytes()), tuple(df.columns))
+
+
+DF_HASH_FUNCS = {pd.DataFrame: _df_fingerprint}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def dedupe_transactions(df):
+    """Drop repeated statement rows. Cached, and cache_data hands back a fresh copy."""
+    return df.drop_duplicates(subset=['date', 'description', 'debit', 'credit'], keep='first')
+
+
+@st.cache_data(show_spinner="Parsing statement...")
+def parse_statement(raw_bytes):
+    """Parse uploaded statement bytes. Keyed on the bytes, so reruns skip re-parsing the same file."""
+    return load_cibc_csv(raw_bytes)
+
+
+@st.cache_data(show_spinner=False)
+def classify_statement(raw_df):
+    """Classify a parsed statement. Cached so re-processing the same file is free."""
+    return TransactionClassifier().classify_dataframe(raw_df, 'corporate')
+
+
+def summarize_transactions(df):
+    """Debit, credit, ITC and review totals, reduced together from one read of each column."""
+    debit = df['debit'].to_numpy(dtype=float)
+    credit = df['credit'].to_numpy(dtype=float)
+    itc = df['itc_amount'].to_numpy(dtype=float)
+    business = (df['is_personal'] == False).to_numpy()
+    return {
+        'debits': float(debit[debit > 0].sum()),
+        'credits': float(credit[credit > 0].sum()),
+        'itcs': float(np.nansum(itc[business])),
+        'bank_itc': float(itc[business & (itc > 0)].sum()),
+        'needs_review': int((df['needs_review'] == True).sum()),
+    }
+
+
+@dataclass(frozen=True)
+class Aggregates:
+    """Scalars shared by the GST Filing and Final Summary pages."""
+    taxable_revenue: float
+    gst_collected: float
+    bank_itc: float
+    cash_itc: float
+    greg_phone_itc: float
+    lili_phone_itc: float
+    
+    @property
+    def phone_itc(self):
+        return self.greg_phone_itc + self.lili_phone_itc
+    
+    @property
+    def total_itc(self):
+        return self.bank_itc + self.cash_itc + self.phone_itc
+    
+    @property
+    def net_gst(self):
+        return self.gst_collected - self.total_itc
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def compute_aggregates(df, phone_bill, cash_total):
+    """Revenue, GST collected and every ITC source, computed once per input change."""
+    taxable_revenue = get_taxable_revenue(df)
+    totals = summarize_transactions(df)
+    greg_phone_itc, lili_phone_itc = calc_phone_itc(phone_bill)['itc']
+    return Aggregates(
+        taxable_revenue=float(taxable_revenue),
+        gst_collected=float(calc_gst_collected(taxable_revenue)),
+        bank_itc=totals['bank_itc'],
+        cash_itc=cash_total * GST_FRACTION,
+        greg_phone_itc=float(greg_phone_itc),
+        lili_phone_itc=float(lili_phone_itc),
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def calculate_revenue(df):
+    """Break taxable revenue down by payment type for the Revenue page."""
+    # Credits split once into revenue and non-revenue, without an interim all-credits copy
+    has_credit = (df['credit'] > 0).to_numpy()
+    is_revenue = df['cra_category'].isin(REVENUE_CATEGORIES).to_numpy()
+    revenue_df = df[has_credit & is_revenue]
+    
+    source = label_revenue_source(revenue_df['description'], REVENUE_SOURCE_PATTERN).fillna('other').to_numpy()
+    credit = revenue_df['credit'].to_numpy(dtype=float)
+    
+    kind_masks = {kind: source == kind for kind, _ in REVENUE_SOURCE_LABELS}
+    return {
+        'total_revenue': credit.sum(),
+        'revenue_df': revenue_df,
+        'non_revenue_df': df[has_credit & ~is_revenue],
+        **{
+            kind: {'total': credit[mask].sum(), 'count': int(mask.sum())}
+            for kind, mask in kind_masks.items()
+        },
+    }
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def calculate_shareholder_totals(df):
+    """Shareholder distribution and personal-expense totals from a single groupby."""
+    keys = [
+        (df['cra_category'] == 'Shareholder Distribution').to_numpy(),
+        (df['is_personal'] == True).to_numpy(),
+        df['description'].str.contains('Lilibeth|LILIBETH', case=False, na=False).to_numpy(),
+    ]
+    amounts = pd.DataFrame({
+        'debit': df['debit'].to_numpy(),
+        'out': df['debit'].where(df['debit'] > 0, 0.0).to_numpy(),
+        'in': df['credit'].where(df['credit'] > 0, 0.0).to_numpy(),
+    })
+    full_index = pd.MultiIndex.from_product([[False, True]] * 3, names=['distribution', 'personal', 'lilibeth'])
+    sums = amounts.groupby(keys).sum()
+    sums.index.names = full_index.names
+    sums = sums.reindex(full_index, fill_value=0.0)
+    
+    dist = sums.loc[True]
+    lili = dist.xs(True, level='lilibeth')
+    return {
+        'distributions': dist['debit'].sum(),
+        'dist_out': dist['out'].sum(),
+        'dist_in': dist['in'].sum(),
+        'lili_out': lili['out'].sum(),
+        'lili_in': lili['in'].sum(),
+        'personal': sums.xs(True, level='personal')['debit'].sum(),
+    }
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def calculate_fuel_summary(df):
+    """Fuel totals and the monthly fuel table for the Mileage page."""
+    debit = df['debit'].to_numpy(dtype=float)
+    fuel_mask = df['cra_category'].isin(['Fuel & Petroleum', 'Fuel']).to_numpy() & (debit > 0)
+    fuel_df = df.loc[fuel_mask, ['date', 'debit']]
+    monthly = fuel_df.groupby(
+        pd.to_datetime(fuel_df['date']).dt.strftime('%Y-%m').rename('month')
+    ).agg({'debit': ['sum', 'count']}).reset_index()
+    monthly.columns = ['Month', 'Fuel Spend', 'Fills']
+    monthly['Avg/Fill'] = (monthly['Fuel Spend'] / monthly['Fills']).round(2)
+    return {
+        'total_fuel': debit[fuel_mask].sum(),
+        'fills': int(fuel_mask.sum()),
+        'fuel_itc': np.nansum(df['itc_amount'].to_numpy(dtype=float)[fuel_mask]),
+        'monthly': monthly,
+    }
+
+
+# Rows per page in the Transaction Review table
+REVIEW_PAGE_SIZE = 100
+
+def reset_review_page():
+    """Go back to page 1 when a Transaction Review filter changes the row count."""
+    st.session_state.review_page = 1
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def category_options(df):
+    """Transaction Review category filter choices, computed once per statement."""
+    return ['All'] + sorted(df['cra_category'].dropna().unique().tolist())
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def category_summary(df):
+    """Transaction Review per-category totals, computed once per filtered view."""
+    summary = df.groupby('cra_category', observed=True).agg({
+        'debit': 'sum', 'credit': 'sum', 'itc_amount': 'sum'
+    }).round(2)
+    summary.columns = ['Total Debits', 'Total Credits', 'Total ITCs']
+    return summary.sort_values('Total Debits', ascending=False)
+
+
+@st.cache_data(show_spinner=False, hash_funcs=DF_HASH_FUNCS)
+def to_csv_bytes(df):
+    """CSV download payload.
+
+    Download buttons take a partial of this, so the CSV is only built when a
+    button is clicked; the cache covers repeat clicks. These files go to the
+    accountant, so they stay in pandas' format (minimal quoting, True/False,
+    40.0) rather than Arrow's CSV writer, which quotes every string.
+    """
+    return df.to_csv(index=False).encode('utf-8')
+
+
+@st.cache_resource(show_spinner=False)
+def read_static_file(path, mtime):
+    """Bytes of a bundled static file, shared by all sessions (bytes are immutable, so no per-call copy).
+
+    The mtime argument drops the cached copy when the file changes.
+    """
+    return Path(path).read_bytes()
 
 
 # ============================================================
 # PAGE: Upload & Process
 # ============================================================
 if page == "📤 Upload & Process":
-    st.title(f"📤 Upload Bank Statement - FY {st.session_state.fiscal_year}")
+    st.title(f"📤 Upload Bank Statement - FY {fiscal_year}")
     st.caption(f"Period: Dec 1, {fy_start} to Nov 30, {fy_end}")
     st.info("Upload your corporate CIBC statement. The system will automatically classify all transactions.")
     
-    if st.session_state.corporate_df is not None:
-        st.success(f"✅ Existing statement loaded: {len(st.session_state.corporate_df)} transactions")
+    if st.session_state.classified_df is not None:
+        st.success(f"✅ Existing statement loaded: {len(st.session_state.classified_df)} transactions")
         if st.button("🗑️ Clear Existing Statement"):
-            st.session_state.corporate_df = None
             st.session_state.classified_df = None
-            save_dataframe('corporate_df.pkl', None)
-            save_dataframe('classified_df.pkl', None)
+            save_dataframe('classified_df.feather', None)
             st.rerun()
     
     corp_file = st.file_uploader("Corporate Bank Statement (CIBC CSV)", type=['csv'])
     
     if corp_file:
-        content = corp_file.getvalue().decode('utf-8', errors='replace')
-        st.session_state.corporate_df = load_cibc_csv(content)
-        save_dataframe('corporate_df.pkl', st.session_state.corporate_df)
-        st.success(f"✓ Loaded {len(st.session_state.corporate_df)} transactions")
+        # The parsed statement lives in parse_statement's cache; only the classified result is kept
+        corporate_df = parse_statement(corp_file.getvalue())
+        st.success(f"✓ Loaded {len(corporate_df)} transactions")
         
         if st.button("🔄 Process Statement", type="primary"):
             with st.spinner("Classifying transactions..."):
-                classifier = TransactionClassifier()
-                st.session_state.classified_df = classifier.classify_dataframe(
-                    st.session_state.corporate_df, 'corporate'
-                )
-                save_dataframe('classified_df.pkl', st.session_state.classified_df)
+                st.session_state.classified_df = stamp_fingerprint(normalize_classified(classify_statement(corporate_df)))
+                save_dataframe('classified_df.feather', st.session_state.classified_df)
             st.success("✅ Processing complete!")
             st.balloons()
 
@@ -265,7 +527,7 @@ if page == "📤 Upload & Process":
 # PAGE: Cash Expenses
 # ============================================================
 elif page == "💵 Cash Expenses":
-    st.title(f"💵 Cash Paid Expenses - FY {st.session_state.fiscal_year}")
+    st.title(f"💵 Cash Paid Expenses - FY {fiscal_year}")
     st.caption(f"Period: Dec 1, {fy_start} to Nov 30, {fy_end}")
     
     st.warning("""**CRA Receipt Rules:**
@@ -279,10 +541,7 @@ elif page == "💵 Cash Expenses":
         cash_desc = st.text_input("Description", placeholder="e.g., Fuel at Petro-Canada")
         cash_amount = st.number_input("Amount ($)", min_value=0.0, step=0.01)
     with col2:
-        cash_category = st.selectbox("Category", [
-            'Fuel & Petroleum', 'Vehicle Repairs & Maintenance', 'Equipment & Supplies',
-            'Meals & Entertainment (50%)', 'Office Expenses', 'Other Business Expense'
-        ])
+        cash_category = st.selectbox("Category", CASH_CATEGORIES)
         has_receipt = st.checkbox("I have the receipt", value=True)
         cash_notes = st.text_input("Business Purpose")
     
@@ -295,20 +554,21 @@ elif page == "💵 Cash Expenses":
             'has_receipt': has_receipt,
             'notes': cash_notes
         }
-        st.session_state.cash_expenses.append(expense)
+        add_cash_expense(expense)
         save_json('cash_expenses.json', st.session_state.cash_expenses)
         if not has_receipt and cash_amount > 30:
             st.session_state.missing_receipts.append(expense)
             save_json('missing_receipts.json', st.session_state.missing_receipts)
         st.success(f"✅ Added: {cash_desc} - ${cash_amount:.2f}")
     
-    if st.session_state.cash_expenses:
+    cash_expenses = st.session_state.cash_expenses
+    if cash_expenses:
         st.markdown("### Cash Expenses Entered")
-        cash_df = pd.DataFrame(st.session_state.cash_expenses)
+        cash_df = pd.DataFrame(cash_expenses)
         st.dataframe(cash_df, use_container_width=True)
-        total_cash = sum(e['amount'] for e in st.session_state.cash_expenses)
+        total_cash = st.session_state.cash_total
         st.metric("Total Cash Expenses", f"${total_cash:,.2f}")
-        total_itc = sum(e['amount'] * 0.05 / 1.05 for e in st.session_state.cash_expenses)
+        total_itc = total_cash * GST_FRACTION
         st.success(f"**Total Cash ITCs: ${total_itc:.2f}**")
 
 
@@ -316,60 +576,59 @@ elif page == "💵 Cash Expenses":
 # PAGE: Phone & Utilities
 # ============================================================
 elif page == "📱 Phone & Utilities":
-    st.title(f"📱 Phone & Utilities - FY {st.session_state.fiscal_year}")
+    st.title(f"📱 Phone & Utilities - FY {fiscal_year}")
     st.caption(f"Period: Dec 1, {fy_start} to Nov 30, {fy_end}")
     st.markdown("**CRA allows business-use percentage of phone bills. Oilfield contractors typically claim 80-100%.**")
     
-    st.markdown("### 👨 Greg's Phone (51% owner)")
-    col1, col2 = st.columns(2)
-    with col1:
-        greg_monthly = st.number_input("Greg's Monthly Phone Bill ($)", 
-            value=float(st.session_state.phone_bill.get('greg', {}).get('monthly', 0.0)), 
-            min_value=0.0, key='greg_monthly')
-    with col2:
+    # Edits are batched in a form so the page reruns once on save, not per keystroke
+    with st.form('phone_bills'):
+        st.markdown("### Monthly Phone Bills")
+        monthly_df = pd.DataFrame(
+            {'Monthly Bill ($)': [float(st.session_state.phone_bill.get(owner, {}).get('monthly', 0.0)) for owner in PHONE_OWNERS]},
+            index=["👨 Greg", "👩 Lilibeth"]
+        )
+        edited_monthly = st.data_editor(
+            monthly_df, num_rows='fixed', key='phone_monthly',
+            column_config=PHONE_COLUMN_CONFIG
+        )
+        greg_monthly, lili_monthly = edited_monthly['Monthly Bill ($)'].fillna(0.0).to_numpy(dtype=float)
+        
+        st.markdown("### 👨 Greg's Phone (51% owner)")
         greg_pct = st.slider("Greg's Business Use %", 0, 100, 
             st.session_state.phone_bill.get('greg', {}).get('business_pct', 100), key='greg_pct')
-    
-    greg_annual = greg_monthly * 12
-    greg_deductible = greg_annual * (greg_pct / 100)
-    greg_itc = greg_deductible * 0.05 / 1.05
-    col1, col2, col3 = st.columns(3)
-    with col1: st.metric("Annual Cost", f"${greg_annual:,.2f}")
-    with col2: st.metric("Deductible", f"${greg_deductible:,.2f}")
-    with col3: st.metric("ITC", f"${greg_itc:,.2f}")
-    
-    st.markdown("---")
-    st.markdown("### 👩 Lilibeth's Phone (49% owner)")
-    col1, col2 = st.columns(2)
-    with col1:
-        lili_monthly = st.number_input("Lilibeth's Monthly Phone Bill ($)", 
-            value=float(st.session_state.phone_bill.get('lilibeth', {}).get('monthly', 0.0)), 
-            min_value=0.0, key='lili_monthly')
-    with col2:
+        
+        greg_cols = st.columns(3)
+        
+        st.markdown("---")
+        st.markdown("### 👩 Lilibeth's Phone (49% owner)")
         lili_pct = st.slider("Lilibeth's Business Use %", 0, 100, 
             st.session_state.phone_bill.get('lilibeth', {}).get('business_pct', 100), key='lili_pct')
+        
+        lili_cols = st.columns(3)
+        
+        submitted = st.form_submit_button("💾 Save Phone Bills")
     
-    lili_annual = lili_monthly * 12
-    lili_deductible = lili_annual * (lili_pct / 100)
-    lili_itc = lili_deductible * 0.05 / 1.05
-    col1, col2, col3 = st.columns(3)
-    with col1: st.metric("Annual Cost", f"${lili_annual:,.2f}")
-    with col2: st.metric("Deductible", f"${lili_deductible:,.2f}")
-    with col3: st.metric("ITC", f"${lili_itc:,.2f}")
+    phone_bill = {
+        'greg': {'monthly': float(greg_monthly), 'business_pct': greg_pct},
+        'lilibeth': {'monthly': float(lili_monthly), 'business_pct': lili_pct}
+    }
+    phone = calc_phone_itc(phone_bill)
+    for cols, i in [(greg_cols, 0), (lili_cols, 1)]:
+        with cols[0]: st.metric("Annual Cost", f"${phone['annual'][i]:,.2f}")
+        with cols[1]: st.metric("Deductible", f"${phone['deductible'][i]:,.2f}")
+        with cols[2]: st.metric("ITC", f"${phone['itc'][i]:,.2f}")
     
     st.markdown("---")
-    total_phone_itc = greg_itc + lili_itc
     col1, col2, col3 = st.columns(3)
-    with col1: st.metric("Total Annual", f"${greg_annual + lili_annual:,.2f}")
-    with col2: st.metric("Total Deductible", f"${greg_deductible + lili_deductible:,.2f}")
-    with col3: st.metric("Total ITC", f"${total_phone_itc:,.2f}")
-    
-    if st.button("💾 Save Phone Bills"):
-        st.session_state.phone_bill = {
-            'greg': {'monthly': float(greg_monthly), 'business_pct': greg_pct},
-            'lilibeth': {'monthly': float(lili_monthly), 'business_pct': lili_pct}
-        }
-        save_json('phone_bill.json', st.session_state.phone_bill)
+    with col1: st.metric("Total Annual", f"${phone['annual'].sum():,.2f}")
+    with col2: st.metric("Total Deductible", f"${phone['deductible'].sum():,.2f}")
+    with col3: st.metric("Total ITC", f"${phone['itc'].sum():,.2f}")
+    
+    if submitted:
+        # Re-submitting unchanged values doesn't touch the file
+        if phone_bill != st.session_state.phone_bill:
+            st.session_state.phone_bill = phone_bill
+            save_json('phone_bill.json', phone_bill)
         st.success("💾 Saved!")
 
 
@@ -377,7 +636,7 @@ elif page == "📱 Phone & Utilities":
 # PAGE: Revenue
 # ============================================================
 elif page == "💰 Revenue":
-    st.title(f"💰 Revenue - FY {st.session_state.fiscal_year}")
+    st.title(f"💰 Revenue - FY {fiscal_year}")
     st.caption(f"Period: Dec 1, {fy_start} to Nov 30, {fy_end}")
     
     df = get_clean_df()
@@ -386,29 +645,16 @@ elif page == "💰 Revenue":
         st.stop()
     
     # FIX #2: Only count actual revenue category, not all credits
-    revenue_categories = ['Revenue', 'Revenue - Oilfield Services']
-    revenue_df = df[df['cra_category'].isin(revenue_categories) & (df['credit'] > 0)]
-    total_revenue = revenue_df['credit'].sum()
+    rev = calculate_revenue(df)
+    revenue_df = rev['revenue_df']
+    total_revenue = rev['total_revenue']
     
-    # Break down by payment type
-    wire_mask = revenue_df['description'].str.contains('WIRE TSF', case=False, na=False)
-    mobile_mask = revenue_df['description'].str.contains('MOBILE DEPOSIT', case=False, na=False)
-    branch_mask = revenue_df['description'].str.contains('BRANCH|DEPOSIT', case=False, na=False) & ~wire_mask & ~mobile_mask
-    
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Wire Transfers", f"${revenue_df.loc[wire_mask, 'credit'].sum():,.2f}",
-                  f"{wire_mask.sum()} transactions")
-    with col2:
-        st.metric("Mobile Deposits", f"${revenue_df.loc[mobile_mask, 'credit'].sum():,.2f}",
-                  f"{mobile_mask.sum()} transactions")
-    with col3:
-        st.metric("Branch Deposits", f"${revenue_df.loc[branch_mask, 'credit'].sum():,.2f}",
-                  f"{branch_mask.sum()} transactions")
-    with col4:
-        other_mask = ~wire_mask & ~mobile_mask & ~branch_mask
-        st.metric("Other", f"${revenue_df.loc[other_mask, 'credit'].sum():,.2f}",
-                  f"{other_mask.sum()} transactions")
+    # Break down by payment type, as one table rather than a row of metric widgets
+    st.table(pd.DataFrame({
+        'Source': [label for _, label in REVENUE_SOURCE_LABELS],
+        'Amount': [f"${rev[kind]['total']:,.2f}" for kind, _ in REVENUE_SOURCE_LABELS],
+        'Transactions': [rev[kind]['count'] for kind, _ in REVENUE_SOURCE_LABELS],
+    }).set_index('Source'))
     
     st.markdown("---")
     st.metric("**TOTAL TAXABLE REVENUE**", f"${total_revenue:,.2f}")
@@ -423,8 +669,7 @@ elif page == "💰 Revenue":
     )
     
     # Show non-revenue credits for transparency
-    all_credits = df[df['credit'] > 0]
-    non_revenue = all_credits[~all_credits['cra_category'].isin(revenue_categories)]
+    non_revenue = rev['non_revenue_df']
     if len(non_revenue) > 0:
         st.markdown("---")
         st.markdown("### Non-Revenue Credits (excluded from taxable revenue)")
@@ -440,7 +685,7 @@ elif page == "💰 Revenue":
 # PAGE: Transaction Review (FIX #7: added export button)
 # ============================================================
 elif page == "📊 Transaction Review":
-    st.title(f"📊 Transaction Review - FY {st.session_state.fiscal_year}")
+    st.title(f"📊 Transaction Review - FY {fiscal_year}")
     df = get_clean_df()
     if df is None:
         st.warning("Please upload and process a statement first.")
@@ -448,27 +693,27 @@ elif page == "📊 Transaction Review":
     
     col1, col2 = st.columns(2)
     with col1:
-        cats = ['All'] + sorted(df['cra_category'].unique().tolist())
-        cat_filter = st.selectbox("Category", cats)
+        cat_filter = st.selectbox("Category", category_options(df), on_change=reset_review_page)
     with col2:
-        status = st.selectbox("Status", ['All', 'Needs Review', 'Personal', 'Business'])
+        status = st.selectbox("Status", ['All', 'Needs Review', 'Personal', 'Business'], on_change=reset_review_page)
     
-    mask = pd.Series([True] * len(df), index=df.index)
-    if cat_filter != 'All':
-        mask &= df['cra_category'] == cat_filter
-    if status == 'Needs Review':
-        mask &= df['needs_review'] == True
-    elif status == 'Personal':
-        mask &= df['is_personal'] == True
-    elif status == 'Business':
-        mask &= df['is_personal'] == False
-    
-    filtered = df[mask]
-    
-    total_debits = filtered[filtered['debit'] > 0]['debit'].sum()
-    total_credits = filtered[filtered['credit'] > 0]['credit'].sum()
-    total_itcs = filtered[filtered['is_personal'] == False]['itc_amount'].sum()
-    needs_review_count = len(filtered[filtered['needs_review'] == True])
+    if cat_filter == 'All' and status == 'All':
+        filtered = df
+    else:
+        mask = np.ones(len(df), dtype=bool)
+        if cat_filter != 'All':
+            mask &= (df['cra_category'] == cat_filter).to_numpy()
+        if status == 'Needs Review':
+            mask &= (df['needs_review'] == True).to_numpy()
+        elif status == 'Personal':
+            mask &= (df['is_personal'] == True).to_numpy()
+        elif status == 'Business':
+            mask &= (df['is_personal'] == False).to_numpy()
+        filtered = df[mask]
+    
+    totals = summarize_transactions(filtered)
+    total_debits, total_credits = totals['debits'], totals['credits']
+    total_itcs, needs_review_count = totals['itcs'], totals['needs_review']
     
     col1, col2, col3, col4 = st.columns(4)
     with col1: st.metric("Transactions", len(filtered))
@@ -479,8 +724,15 @@ elif page == "📊 Transaction Review":
     if total_credits > 0:
         st.metric("Total Credits (In)", f"${total_credits:,.2f}")
     
+    # Only one page of rows is sent to the browser; the metrics above and the
+    # exports below still cover the full filtered set
+    page_count = max(1, -(-len(filtered) // REVIEW_PAGE_SIZE))
+    page_n = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1, key="review_page")
+    start = (page_n - 1) * REVIEW_PAGE_SIZE
+    st.caption(f"Showing rows {min(start + 1, len(filtered))}–{min(start + REVIEW_PAGE_SIZE, len(filtered))} of {len(filtered)}")
     st.dataframe(
-        filtered[['date', 'description', 'debit', 'credit', 'cra_category', 'itc_amount', 'is_personal', 'needs_review']], 
+        filtered[['date', 'description', 'debit', 'credit', 'cra_category', 'itc_amount', 'is_personal', 'needs_review']]
+        .iloc[start:start + REVIEW_PAGE_SIZE],
         use_container_width=True, height=500
     )
     
@@ -490,33 +742,28 @@ elif page == "📊 Transaction Review":
     with col1:
         st.download_button(
             "📥 Export Filtered Transactions (CSV)",
-            filtered.to_csv(index=False),
-            f"transactions_filtered_FY{st.session_state.fiscal_year}.csv",
+            partial(to_csv_bytes, filtered),
+            f"transactions_filtered_FY{fiscal_year}.csv",
             "text/csv"
         )
     with col2:
         st.download_button(
             "📥 Export ALL Transactions (CSV)",
-            df.to_csv(index=False),
-            f"transactions_ALL_FY{st.session_state.fiscal_year}.csv",
+            partial(to_csv_bytes, df),
+            f"transactions_ALL_FY{fiscal_year}.csv",
             "text/csv"
         )
     
     st.markdown("---")
     st.markdown("### Summary by Category")
-    summary = filtered.groupby('cra_category').agg({
-        'debit': 'sum', 'credit': 'sum', 'itc_amount': 'sum'
-    }).round(2)
-    summary.columns = ['Total Debits', 'Total Credits', 'Total ITCs']
-    summary = summary.sort_values('Total Debits', ascending=False)
-    st.dataframe(summary, use_container_width=True)
+    st.dataframe(category_summary(filtered), use_container_width=True)
 
 
 # ============================================================
 # PAGE: GST Filing (FIX #1: 5/105 extraction, FIX #5: display)
 # ============================================================
 elif page == "💰 GST Filing":
-    st.title(f"💰 GST/HST Return - FY {st.session_state.fiscal_year}")
+    st.title(f"💰 GST/HST Return - FY {fiscal_year}")
     st.caption(f"Period: Dec 1, {fy_start} to Nov 30, {fy_end}")
     df = get_clean_df()
     if df is None:
@@ -524,43 +771,43 @@ elif page == "💰 GST Filing":
         st.stop()
     
     # FIX #1 & #2: Use only taxable revenue with 5/105 extraction
-    taxable_revenue = get_taxable_revenue(df)
-    gst_collected = calc_gst_collected(taxable_revenue)
-    
-    # ITCs from bank transactions
-    itc_eligible = df[(df['is_personal'] == False) & (df['itc_amount'] > 0)]
-    bank_itc = itc_eligible['itc_amount'].sum()
-    
-    # Cash ITCs
-    cash_itc = sum(e['amount'] * 0.05 / 1.05 for e in st.session_state.cash_expenses)
-    
-    # Phone ITCs
-    greg_phone = st.session_state.phone_bill.get('greg', {})
-    lili_phone = st.session_state.phone_bill.get('lilibeth', {})
-    greg_phone_itc = (greg_phone.get('monthly', 0.0) * 12 * greg_phone.get('business_pct', 100) / 100) * 0.05 / 1.05
-    lili_phone_itc = (lili_phone.get('monthly', 0.0) * 12 * lili_phone.get('business_pct', 100) / 100) * 0.05 / 1.05
-    phone_itc = greg_phone_itc + lili_phone_itc
-    total_itc = bank_itc + cash_itc + phone_itc
+    # ITCs from bank transactions, cash expenses and phones
+    agg = compute_aggregates(df, st.session_state.phone_bill, st.session_state.cash_total)
+    taxable_revenue, gst_collected = agg.taxable_revenue, agg.gst_collected
+    bank_itc, cash_itc = agg.bank_itc, agg.cash_itc
+    greg_phone_itc, lili_phone_itc = agg.greg_phone_itc, agg.lili_phone_itc
+    phone_itc, total_itc = agg.phone_itc, agg.total_itc
+    
+    net_gst = agg.net_gst
+    # Each figure appears in the metrics, the GST34 table and the calculation
+    # detail; format it once
+    fmt = {
+        name: f"${value:,.2f}" for name, value in [
+            ('taxable_revenue', taxable_revenue), ('gst_collected', gst_collected),
+            ('bank_itc', bank_itc), ('cash_itc', cash_itc), ('phone_itc', phone_itc),
+            ('greg_phone_itc', greg_phone_itc), ('lili_phone_itc', lili_phone_itc),
+            ('total_itc', total_itc), ('net_gst', net_gst), ('net_gst_abs', abs(net_gst)),
+        ]
+    }
     
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("### GST Collected")
-        st.metric("Taxable Revenue (GST-inclusive)", f"${taxable_revenue:,.2f}")
+        st.metric("Taxable Revenue (GST-inclusive)", fmt['taxable_revenue'])
         # FIX #5: Display shows correct formula
-        st.metric("GST Collected (5/105 extraction)", f"${gst_collected:,.2f}")
+        st.metric("GST Collected (5/105 extraction)", fmt['gst_collected'])
     with col2:
         st.markdown("### Input Tax Credits")
-        st.metric("Bank ITCs", f"${bank_itc:,.2f}")
-        st.metric("Cash ITCs", f"${cash_itc:,.2f}")
-        st.metric("Phone ITCs", f"${phone_itc:,.2f}")
-        st.metric("**TOTAL ITCs**", f"${total_itc:,.2f}")
+        st.metric("Bank ITCs", fmt['bank_itc'])
+        st.metric("Cash ITCs", fmt['cash_itc'])
+        st.metric("Phone ITCs", fmt['phone_itc'])
+        st.metric("**TOTAL ITCs**", fmt['total_itc'])
     
     st.markdown("---")
-    net_gst = gst_collected - total_itc
     if net_gst > 0:
-        st.error(f"## 📤 NET GST OWING: ${net_gst:,.2f}")
+        st.error(f"## 📤 NET GST OWING: {fmt['net_gst']}")
     else:
-        st.success(f"## 📥 NET GST REFUND: ${abs(net_gst):,.2f}")
+        st.success(f"## 📥 NET GST REFUND: {fmt['net_gst_abs']}")
     
     st.markdown("---")
     st.markdown("### GST34 Line Summary")
@@ -573,34 +820,36 @@ elif page == "💰 GST Filing":
             'Net tax (remit or refund)'
         ],
         'Amount': [
-            f"${taxable_revenue:,.2f}",
-            f"${gst_collected:,.2f}",
-            f"${total_itc:,.2f}",
-            f"${net_gst:,.2f}" if net_gst > 0 else f"(${abs(net_gst):,.2f})"
+            fmt['taxable_revenue'],
+            fmt['gst_collected'],
+            fmt['total_itc'],
+            fmt['net_gst'] if net_gst > 0 else f"({fmt['net_gst_abs']})"
         ]
     }
     st.table(pd.DataFrame(gst34_data))
     
     # FIX #5: Corrected display formula
     st.markdown("### 🧮 Calculation Detail")
-    st.info(f"""**GST Collected (5/105 extraction from GST-inclusive revenue):**
-    ${taxable_revenue:,.2f} × 5 ÷ 105 = ${gst_collected:,.2f}
-    
-    **ITCs:**
-    - Bank transactions: ${bank_itc:,.2f}
-    - Cash expenses: ${cash_itc:.2f}
-    - Greg's phone: ${greg_phone_itc:.2f}
-    - Lilibeth's phone: ${lili_phone_itc:.2f}
-    - **Total ITCs:** ${total_itc:.2f}
-    
-    **Net:** ${gst_collected:,.2f} - ${total_itc:.2f} = ${net_gst:,.2f}""")
+    st.info("\n".join([
+        "**GST Collected (5/105 extraction from GST-inclusive revenue):**",
+        f"{fmt['taxable_revenue']} × 5 ÷ 105 = {fmt['gst_collected']}",
+        "",
+        "**ITCs:**",
+        f"- Bank transactions: {fmt['bank_itc']}",
+        f"- Cash expenses: {fmt['cash_itc']}",
+        f"- Greg's phone: {fmt['greg_phone_itc']}",
+        f"- Lilibeth's phone: {fmt['lili_phone_itc']}",
+        f"- **Total ITCs:** {fmt['total_itc']}",
+        "",
+        f"**Net:** {fmt['gst_collected']} - {fmt['total_itc']} = {fmt['net_gst']}",
+    ]))
 
 
 # ============================================================
 # PAGE: Shareholder Accounts (FIX #4: per-person tracking)
 # ============================================================
 elif page == "👥 Shareholder Accounts":
-    st.title(f"👥 Shareholder Loans - FY {st.session_state.fiscal_year}")
+    st.title(f"👥 Shareholder Loans - FY {fiscal_year}")
     df = get_clean_df()
     if df is None:
         st.warning("Please upload and process a statement first.")
@@ -610,38 +859,27 @@ elif page == "👥 Shareholder Accounts":
     
     # FIX #4: Track distributions by who they went to
     dist_df = df[df['cra_category'] == 'Shareholder Distribution']
-    personal_df = df[df['is_personal'] == True]
+    shareholder = calculate_shareholder_totals(df)
     
     # Identify Lilibeth's specific transactions
-    lili_dist_out = dist_df[
-        (dist_df['debit'] > 0) & 
-        dist_df['description'].str.contains('Lilibeth|LILIBETH', case=False, na=False)
-    ]['debit'].sum()
-    
-    lili_dist_in = dist_df[
-        (dist_df['credit'] > 0) & 
-        dist_df['description'].str.contains('Lilibeth|LILIBETH', case=False, na=False)
-    ]['credit'].sum()
+    lili_dist_out = shareholder['lili_out']
+    lili_dist_in = shareholder['lili_in']
     
     # ATM withdrawals and unattributed distributions go to Greg (primary operator)
-    total_dist_out = dist_df[dist_df['debit'] > 0]['debit'].sum()
-    total_dist_in = dist_df[dist_df['credit'] > 0]['credit'].sum()
+    total_dist_out = shareholder['dist_out']
+    total_dist_in = shareholder['dist_in']
     greg_dist_out = total_dist_out - lili_dist_out
     greg_dist_in = total_dist_in - lili_dist_in
     
-    total_personal = personal_df['debit'].sum()
-    
-    st.markdown("### 👨 Greg MacDonald (51% owner)")
-    col1, col2, col3 = st.columns(3)
-    with col1: st.metric("Distributions Out", f"${greg_dist_out:,.2f}")
-    with col2: st.metric("Repayments In", f"${greg_dist_in:,.2f}")
-    with col3: st.metric("Net", f"${greg_dist_out - greg_dist_in:,.2f}")
+    total_personal = shareholder['personal']
     
-    st.markdown("### 👩 Lilibeth Sejera (49% owner)")
-    col1, col2, col3 = st.columns(3)
-    with col1: st.metric("Distributions Out", f"${lili_dist_out:,.2f}")
-    with col2: st.metric("Repayments In", f"${lili_dist_in:,.2f}")
-    with col3: st.metric("Net", f"${lili_dist_out - lili_dist_in:,.2f}")
+    st.markdown("### Distributions by Shareholder")
+    st.table(pd.DataFrame({
+        'Shareholder': ["👨 Greg MacDonald (51% owner)", "👩 Lilibeth Sejera (49% owner)"],
+        'Distributions Out': [f"${greg_dist_out:,.2f}", f"${lili_dist_out:,.2f}"],
+        'Repayments In': [f"${greg_dist_in:,.2f}", f"${lili_dist_in:,.2f}"],
+        'Net': [f"${greg_dist_out - greg_dist_in:,.2f}", f"${lili_dist_out - lili_dist_in:,.2f}"],
+    }).set_index('Shareholder'))
     
     st.markdown("---")
     st.markdown("### Summary")
@@ -668,7 +906,7 @@ elif page == "👥 Shareholder Accounts":
 # PAGE: T5 Slips (FIX #3: editable split, FIX: duplicate removed)
 # ============================================================
 elif page == "📄 T5 Slips":
-    st.title(f"📄 T5 Investment Income Slips - FY {st.session_state.fiscal_year}")
+    st.title(f"📄 T5 Investment Income Slips - FY {fiscal_year}")
     st.caption(f"Period: Dec 1, {fy_start} to Nov 30, {fy_end}")
     st.info("**CRA Requirement:** T5 slips must be filed by last day of February following the tax year")
     
@@ -677,7 +915,7 @@ elif page == "📄 T5 Slips":
         st.warning("Please upload and process a statement first.")
         st.stop()
     
-    distributions = df[df['cra_category'] == 'Shareholder Distribution']['debit'].sum()
+    distributions = calculate_shareholder_totals(df)['distributions']
     
     st.markdown("### 💰 Dividend Information")
     
@@ -765,8 +1003,8 @@ elif page == "📄 T5 Slips":
             {'Name': 'Lilibeth Sejera', 'SIN': '', 'Actual_Dividend': lili_dividend, 'Grossup': lili_grossup,
              'Taxable_Amount': lili_taxable, 'Fed_Credit': lili_credit, 'Type': dividend_type}
         ])
-        st.download_button("📥 Download T5 Data (CSV)", t5_csv.to_csv(index=False), 
-                          f"T5_Slips_FY{st.session_state.fiscal_year}.csv", "text/csv")
+        st.download_button("📥 Download T5 Data (CSV)", partial(to_csv_bytes, t5_csv), 
+                          f"T5_Slips_FY{fiscal_year}.csv", "text/csv")
     else:
         st.info("No dividends paid this fiscal year. T5 slips not required.")
 
@@ -775,7 +1013,7 @@ elif page == "📄 T5 Slips":
 # PAGE: Mileage Log (embeds the CRA-compliant HTML log)
 # ============================================================
 elif page == "🚛 Mileage Log":
-    st.title(f"🚛 Mileage & Fuel Summary - FY {st.session_state.fiscal_year}")
+    st.title(f"🚛 Mileage & Fuel Summary - FY {fiscal_year}")
     st.caption("Chevrolet Silverado — 100% Business Use")
     
     df = get_clean_df()
@@ -792,24 +1030,16 @@ elif page == "🚛 Mileage Log":
     
     # Fuel from bank transactions
     if df is not None:
-        fuel_categories = ['Fuel & Petroleum', 'Fuel']
-        fuel_df = df[df['cra_category'].isin(fuel_categories) & (df['debit'] > 0)]
-        total_fuel = fuel_df['debit'].sum()
-        fuel_itc = fuel_df['itc_amount'].sum()
+        fuel = calculate_fuel_summary(df)
         
         col1, col2, col3 = st.columns(3)
-        with col1: st.metric("Total Fuel (Company Card)", f"${total_fuel:,.2f}")
-        with col2: st.metric("Fuel Fills", f"{len(fuel_df)}")
-        with col3: st.metric("Fuel ITCs", f"${fuel_itc:,.2f}")
+        with col1: st.metric("Total Fuel (Company Card)", f"${fuel['total_fuel']:,.2f}")
+        with col2: st.metric("Fuel Fills", f"{fuel['fills']}")
+        with col3: st.metric("Fuel ITCs", f"${fuel['fuel_itc']:,.2f}")
         
         st.markdown("---")
         st.markdown("### 📅 Monthly Fuel Breakdown")
-        fuel_df = fuel_df.copy()
-        fuel_df['month'] = pd.to_datetime(fuel_df['date']).dt.strftime('%Y-%m')
-        monthly = fuel_df.groupby('month').agg({'debit': ['sum', 'count']}).reset_index()
-        monthly.columns = ['Month', 'Fuel Spend', 'Fills']
-        monthly['Avg/Fill'] = (monthly['Fuel Spend'] / monthly['Fills']).round(2)
-        st.dataframe(monthly, use_container_width=True)
+        st.dataframe(fuel['monthly'], use_container_width=True)
     
     st.markdown("---")
     st.markdown("### ⛽ Fuel Economy Note")
@@ -838,14 +1068,16 @@ elif page == "🚛 Mileage Log":
     mileage_html_path = Path(__file__).parent / "static" / "mileage_log_FY2024-2025.html"
     if mileage_html_path.exists():
         import streamlit.components.v1 as components
-        with open(mileage_html_path, 'r') as f:
-            html_content = f.read()
-        components.html(html_content, height=800, scrolling=True)
+        # The download gets the file's bytes as-is, so Streamlit has nothing to re-encode
+        html_bytes = read_static_file(str(mileage_html_path), mileage_html_path.stat().st_mtime)
+        # The embedded log is large; only send it to the browser when asked for
+        if st.toggle("Show full mileage log", key='mileage_expanded'):
+            components.html(html_bytes.decode('utf-8'), height=800, scrolling=True)
         
         # Download button
         st.download_button(
             "📥 Download Mileage Log (HTML)",
-            html_content,
+            html_bytes,
             "RigBooks_CRA_Mileage_Log_FY2024-2025.html",
             "text/html"
         )
@@ -857,7 +1089,7 @@ elif page == "🚛 Mileage Log":
 # PAGE: Receipt Tracker
 # ============================================================
 elif page == "🧾 Receipt Tracker":
-    st.title(f"🧾 Receipt Tracker - FY {st.session_state.fiscal_year}")
+    st.title(f"🧾 Receipt Tracker - FY {fiscal_year}")
     st.markdown("""| Amount | Receipt? |
     |--------|----------|
     | < $30 | ❌ No |
@@ -866,35 +1098,30 @@ elif page == "🧾 Receipt Tracker":
     
     df = get_clean_df()
     if df is not None:
-        needs_receipts = df[(df['debit'] > 150) & (df['itc_amount'] > 0)]
-        st.markdown(f"### Over $150: {len(needs_receipts)} transactions")
-        if len(needs_receipts) > 0:
-            st.dataframe(needs_receipts[['date', 'description', 'debit', 'itc_amount']].sort_values('debit', ascending=False))
-            st.warning(f"⚠️ ITCs at risk without receipts: ${needs_receipts['itc_amount'].sum():,.2f}")
+        itc = df['itc_amount'].to_numpy(dtype=float)
+        receipt_mask = (df['debit'].to_numpy(dtype=float) > 150) & (itc > 0)
+        receipt_count = int(receipt_mask.sum())
+        st.markdown(f"### Over $150: {receipt_count} transactions")
+        if receipt_count > 0:
+            st.dataframe(df.loc[receipt_mask, ['date', 'description', 'debit', 'itc_amount']].sort_values('debit', ascending=False))
+            st.warning(f"⚠️ ITCs at risk without receipts: ${itc[receipt_mask].sum():,.2f}")
 
 
 # ============================================================
 # PAGE: Final Summary
 # ============================================================
 elif page == "📋 Final Summary":
-    st.title(f"📋 Final Summary - FY {st.session_state.fiscal_year}")
+    st.title(f"📋 Final Summary - FY {fiscal_year}")
     df = get_clean_df()
     if df is None:
         st.warning("Please upload and process a statement first.")
         st.stop()
     
     # FIX #1 & #2: Corrected GST calculation
-    taxable_revenue = get_taxable_revenue(df)
-    gst_collected = calc_gst_collected(taxable_revenue)
-    
-    bank_itc = df[(df['is_personal'] == False) & (df['itc_amount'] > 0)]['itc_amount'].sum()
-    cash_itc = sum(e['amount'] * 0.05 / 1.05 for e in st.session_state.cash_expenses)
-    greg_phone = st.session_state.phone_bill.get('greg', {})
-    lili_phone = st.session_state.phone_bill.get('lilibeth', {})
-    phone_itc = ((greg_phone.get('monthly', 0.0) * 12 * greg_phone.get('business_pct', 100) / 100) + 
-                 (lili_phone.get('monthly', 0.0) * 12 * lili_phone.get('business_pct', 100) / 100)) * 0.05 / 1.05
-    total_itc = bank_itc + cash_itc + phone_itc
-    net_gst = gst_collected - total_itc
+    agg = compute_aggregates(df, st.session_state.phone_bill, st.session_state.cash_total)
+    taxable_revenue, gst_collected = agg.taxable_revenue, agg.gst_collected
+    bank_itc, cash_itc, phone_itc = agg.bank_itc, agg.cash_itc, agg.phone_itc
+    total_itc, net_gst = agg.total_itc, agg.net_gst
     
     st.markdown("## GST Summary")
     col1, col2, col3 = st.columns(3)
@@ -909,12 +1136,12 @@ elif page == "📋 Final Summary":
     st.markdown("---")
     col1, col2 = st.columns(2)
     with col1:
-        st.download_button("📥 All Transactions (CSV)", df.to_csv(index=False), 
-                          f"transactions_FY{st.session_state.fiscal_year}.csv", "text/csv")
+        st.download_button("📥 All Transactions (CSV)", partial(to_csv_bytes, df), 
+                          f"transactions_FY{fiscal_year}.csv", "text/csv")
     with col2:
-        gst_df = df[df['itc_amount'] > 0][['date', 'description', 'debit', 'cra_category', 'itc_amount']]
-        st.download_button("📥 GST Working Papers (CSV)", gst_df.to_csv(index=False), 
-                          f"gst_itc_FY{st.session_state.fiscal_year}.csv", "text/csv")
+        itc_rows = df.loc[df['itc_amount'] > 0, ['date', 'description', 'debit', 'cra_category', 'itc_amount']]
+        st.download_button("📥 GST Working Papers (CSV)", partial(to_csv_bytes, itc_rows), 
+                          f"gst_itc_FY{fiscal_year}.csv", "text/csv")
 
 
 # ============================================================
@@ -43,10 +43,11 @@ FISCAL_YEARS = ["2024-2025", "2025-2026"]
 
 
 def migrate_transactions(fy_name: str) -> int:
-    """Migrate classified_df.pkl (or corporate_df.pkl) into transactions table."""
+    """Migrate classified_df.feather/.pkl (or corporate_df.pkl) into transactions table."""
     fy_dir = DATA_DIR / fy_name
 
     # Try classified first (has categories), fall back to corporate
+    classified_feather_path = fy_dir / "classified_df.feather"
     classified_path = fy_dir / "classified_df.pkl"
     corporate_path = fy_dir / "corporate_df.pkl"
     csv_backup_path = fy_dir / "classified_backup.csv"
@@ -54,7 +55,14 @@ def migrate_transactions(fy_name: str) -> int:
     df = None
     source = ""
 
-    if classified_path.exists():
+    if classified_feather_path.exists():
+        try:
+            df = pd.read_feather(classified_feather_path)
+            source = "classified_df.feather"
+        except Exception as e:
+            logger.warning("ANNEALING: Failed to read %s: %s", classified_feather_path, e)
+
+    if df is None and classified_path.exists():
         try:
             df = pd.read_pickle(classified_path)
             source = "classified_df.pkl"
@@ -95,6 +103,9 @@ def migrate_transactions(fy_name: str) -> int:
             df[col] = default
             logger.info("ANNEALING: Added missing column '%s' with default", col)
 
+    # Saved frames keep cra_category categorical, which rejects the fill value below
+    df["cra_category"] = df["cra_category"].astype(object)
+
     # Fill NaN values
     df = df.fillna({"debit": 0, "credit": 0, "notes": "", "cra_category": "Other / Unclassified"})
 
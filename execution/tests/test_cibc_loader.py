@@ -0,0 +1,27 @@
+"""Tests for helpers/cibc_loader.py — CIBC CSV export parsing."""
+import sys
+from pathlib import Path
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers.cibc_loader import load_cibc_csv, _load_cibc_csv_lines
+
+
+class TestLoadCibcCsv:
+    def test_na_like_descriptions_kept(self):
+        df = load_cibc_csv(b"2024-12-02,NA,100.00,\n2024-12-03,null,,50.00\n")
+        assert list(df['description']) == ["NA", "null"]
+        assert list(df['debit']) == [100.0, 0.0]
+        assert list(df['credit']) == [0.0, 50.0]
+
+    def test_row_without_amounts_dropped(self):
+        df = load_cibc_csv(b"2024-12-04,FUEL,25.00,\n2024-12-05,ONLYTWO\n")
+        assert list(df['description']) == ["FUEL"]
+
+    def test_fallback_drops_row_without_amounts(self):
+        content = '2024-12-04,"FUEL,25.00,\n2024-12-05,ONLYTWO,,\n'
+        df = _load_cibc_csv_lines(content)
+        assert list(df['description']) == ['"FUEL']
+        assert list(df['debit']) == [25.0]
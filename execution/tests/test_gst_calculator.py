@@ -0,0 +1,53 @@
+"""Tests for helpers/gst_calculator.py — ITC claim validation and revenue breakdown."""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers.gst_calculator import GSTCalculator
+
+
+def _row(description, debit, category, itc_amount, is_personal=False, needs_review=False):
+    return {
+        "date": "2025-01-02", "description": description, "debit": debit, "credit": 0.0,
+        "cra_category": category, "itc_amount": itc_amount,
+        "is_personal": is_personal, "needs_review": needs_review,
+    }
+
+
+class TestValidateItcClaims:
+    def test_issues_in_row_order(self):
+        df = pd.DataFrame([
+            _row("TIM HORTONS", 21.0, "Meals & Entertainment (50%)", 1.0),
+            _row("LIQUOR DEPOT", 45.0, "Bank Charges & Interest", 2.14, is_personal=True),
+            _row("PRINCESS AUTO", 650.0, "Equipment & Supplies", 30.95),
+            _row("SHELL", 80.0, "Fuel & Petroleum", 3.81),
+        ])
+        issues = GSTCalculator().validate_itc_claims(df)
+        assert issues["description"].tolist() == ["TIM HORTONS", "LIQUOR DEPOT", "LIQUOR DEPOT", "PRINCESS AUTO"]
+        assert issues["severity"].tolist() == ["MEDIUM", "HIGH", "HIGH", "LOW"]
+        assert issues["issue"].iloc[0] == "Meals ITC should be 50% ($0.50), claimed $1.00"
+        assert issues["issue"].iloc[2] == "ITC claimed on exempt category: Bank Charges & Interest"
+        assert issues["amount"].iloc[3] == 650.0
+
+    def test_no_issues(self):
+        df = pd.DataFrame([_row("SHELL", 80.0, "Fuel & Petroleum", 3.81)])
+        assert GSTCalculator().validate_itc_claims(df).empty
+
+
+class TestRevenueBreakdown:
+    def test_overlapping_sources_count_in_each(self):
+        df = pd.DataFrame([
+            {"date": "2025-01-02", "description": "WIRE TSF MOBILE DEPOSIT", "debit": 0.0,
+             "credit": 1050.0, "cra_category": "Revenue - Oilfield Services"},
+            {"date": "2025-01-03", "description": "Branch Deposit", "debit": 0.0,
+             "credit": 210.0, "cra_category": "Revenue - Oilfield Services"},
+        ])
+        breakdown = GSTCalculator().calculate_revenue_breakdown(df)
+        assert breakdown["wire_transfers"] == {"total": 1050.0, "count": 1}
+        assert breakdown["mobile_deposits"] == {"total": 1050.0, "count": 1}
+        assert breakdown["branch_deposits"] == {"total": 210.0, "count": 1}
@@ -0,0 +1,48 @@
+"""Tests for helpers/revenue_simple.py — single-pass revenue source labelling."""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers.revenue_simple import calculate_revenue, label_revenue_source
+
+
+class TestLabelRevenueSource:
+    def test_first_source_wins(self):
+        descriptions = pd.Series([
+            "MOBILE DEPOSIT ref WIRE TSF",
+            "wire tsf long run",
+            "Counter Deposit",
+            "E-TRANSFER",
+        ])
+        labels = label_revenue_source(descriptions)
+        assert labels.iloc[0] == "wire"
+        assert labels.iloc[1] == "wire"
+        assert labels.iloc[2] == "branch"
+        assert pd.isna(labels.iloc[3])
+
+
+class TestCalculateRevenue:
+    def test_totals_by_source(self):
+        df = pd.DataFrame([
+            {"date": "2025-01-02", "description": "WIRE TSF LONG RUN", "debit": 0.0, "credit": 5000.0},
+            {"date": "2025-01-02", "description": "WIRE TSF LONG RUN", "debit": 0.0, "credit": 5000.0},
+            {"date": "2025-01-03", "description": "MOBILE DEPOSIT", "debit": 0.0, "credit": 250.0},
+            {"date": "2025-01-04", "description": "BRANCH DEPOSIT", "debit": 0.0, "credit": 100.0},
+            {"date": "2025-01-05", "description": "BRANCH DEPOSIT", "debit": 40.0, "credit": 0.0},
+        ])
+        result = calculate_revenue(df)
+        assert result["wire_count"] == 1
+        assert result["mobile_total"] == 250.0
+        assert result["branch_count"] == 1
+        assert result["total"] == 5350.0
+
+    def test_no_credits(self):
+        df = pd.DataFrame(columns=["date", "description", "debit", "credit"]).astype({"debit": float, "credit": float})
+        result = calculate_revenue(df)
+        assert result["total"] == 0
+        assert result["wire_df"].empty
@@ -0,0 +1,84 @@
+"""Tests for helpers/transaction_classifier.py — vectorized path vs per-row rules."""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# Ensure project root on path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from helpers.transaction_classifier import PersonalAccountClassifier, TransactionClassifier
+
+
+@pytest.fixture
+def statement():
+    return pd.DataFrame([
+        {"date": "2025-01-02", "description": "WIRE TSF LONG RUN", "debit": 0.0, "credit": 5250.0},
+        {"date": "2025-01-03", "description": "Point of Sale PETRO-CANADA 37", "debit": 80.06, "credit": 0.0},
+        {"date": "2025-01-04", "description": "TIM HORTONS #123", "debit": 12.50, "credit": 0.0},
+        {"date": "2025-01-05", "description": "PRINCESS AUTO EDMONTON", "debit": 650.00, "credit": 0.0},
+        {"date": "2025-01-06", "description": "LIQUOR DEPOT", "debit": 45.00, "credit": 0.0},
+        {"date": "2025-01-07", "description": "GOVERNMENT CANADA", "debit": 0.0, "credit": 300.0},
+        {"date": "2025-01-08", "description": "GOVERNMENT CANADA", "debit": 900.0, "credit": 0.0},
+        {"date": "2025-01-09", "description": "E-TRANSFER Lilibeth Sejera", "debit": 200.0, "credit": 0.0},
+        {"date": "2025-01-10", "description": "SOMETHING NEW", "debit": 31.5, "credit": 0.0},
+        {"date": "2025-01-11", "description": "SOMETHING ELSE", "debit": 0.0, "credit": 99.0},
+        {"date": "2025-01-11", "description": "SOMETHING ELSE", "debit": 0.0, "credit": 99.0},
+    ])
+
+
+# ── classify_dataframe ────────────────────────────────────────────────────
+
+class TestClassifyDataframe:
+    def test_matches_classify_transaction(self, statement):
+        classifier = TransactionClassifier()
+        result = classifier.classify_dataframe(statement)
+        for _, row in result.iterrows():
+            expected = classifier.classify_transaction(row["description"], row["debit"], row["credit"])
+            assert row["cra_category"] == expected["cra_category"]
+            assert bool(row["is_personal"]) == expected["is_personal"]
+            assert bool(row["needs_review"]) == expected["needs_review"]
+            assert row["itc_amount"] == expected["itc_amount"]
+            assert row["notes"] == expected["notes"]
+
+    def test_removes_duplicates(self, statement):
+        result = TransactionClassifier().classify_dataframe(statement)
+        assert len(result) == len(statement) - 1
+
+    def test_first_matching_rule_wins(self):
+        df = pd.DataFrame([
+            {"date": "2025-02-01", "description": "E-TRANSFER Paula Gour", "debit": 0.0, "credit": 40.0},
+        ])
+        result = TransactionClassifier().classify_dataframe(df)
+        assert result.iloc[0]["cra_category"] == "Transfer - Non-Taxable"
+        assert bool(result.iloc[0]["needs_review"])
+
+    def test_empty_dataframe(self):
+        df = pd.DataFrame(columns=["date", "description", "debit", "credit"])
+        result = TransactionClassifier().classify_dataframe(df)
+        assert result.empty
+        assert "cra_category" in result.columns
+
+    def test_category_is_categorical(self, statement):
+        result = TransactionClassifier().classify_dataframe(statement)
+        assert isinstance(result["cra_category"].dtype, pd.CategoricalDtype)
+        assert result["is_personal"].dtype == bool
+        assert result["needs_review"].dtype == bool
+
+
+# ── PersonalAccountClassifier ─────────────────────────────────────────────
+
+class TestIdentifyBusinessExpenses:
+    def test_flags_first_matching_pattern(self):
+        df = pd.DataFrame([
+            {"date": "2025-01-02", "description": "Shell 0042 at Napa", "debit": 60.0, "credit": 0.0},
+            {"date": "2025-01-03", "description": "PRINCESS AUTO", "debit": 20.0, "credit": 0.0},
+            {"date": "2025-01-04", "description": "NETFLIX", "debit": 17.0, "credit": 0.0},
+        ])
+        result = PersonalAccountClassifier().identify_business_expenses(df)
+        assert result["potential_business"].tolist() == [True, True, False]
+        assert result["business_category"].tolist() == [
+            "Fuel - Potential Business", "Supplies - Potential Business", "",
+        ]
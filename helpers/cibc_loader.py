@@ -0,0 +1,102 @@
+"""
+CIBC statement loader for RigBooks
+Cape Bretoner's Oilfield Services Ltd
+
+Parses CIBC CSV exports (date, description, debit, credit[, card number])
+into the four-column frame the classifier expects.
+"""
+
+import csv
+from io import BytesIO, StringIO
+
+import numpy as np
+import pandas as pd
+
+
+CIBC_COLUMNS = ['date', 'description', 'debit', 'credit']
+# CIBC credit card exports carry a trailing card-number column
+CIBC_FIELDS = CIBC_COLUMNS + ['card_number']
+# Amounts are read straight into float64 by the C parser when the file is clean
+CIBC_DTYPES = {'description': 'string[pyarrow]', 'debit': 'float64', 'credit': 'float64'}
+# Only a blank amount is missing; descriptions such as 'NA' or 'null' are real text
+CIBC_NA_VALUES = {'debit': [''], 'credit': ['']}
+
+
+def load_cibc_csv(raw):
+    """Parse a CIBC CSV export (date, description, debit, credit[, card]).
+
+    The upload bytes go straight to pandas' C parser; dates and amounts are
+    coerced column-wise. Rows with an unparseable date or amount, or with no
+    amount at all (blank or absent debit and credit), are dropped; a single
+    blank amount counts as 0. Files the C parser can't tokenize (ragged
+    rows, stray quotes) fall back to the line-by-line parser.
+    """
+    try:
+        df = _read_cibc_frame(raw, CIBC_DTYPES)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame(columns=CIBC_COLUMNS)
+    except pd.errors.ParserError:
+        return _load_cibc_csv_lines(raw.decode('utf-8', errors='replace'))
+    except ValueError:
+        # Text in an amount column: read amounts as strings and coerce them below
+        df = _read_cibc_frame(raw, {'description': 'string[pyarrow]'})
+
+    amounts = df[['debit', 'credit']].apply(pd.to_numeric, errors='coerce')
+    # 'mixed' parses each value on its own, so one file can mix date formats
+    dates = pd.to_datetime(df['date'].astype(str).str.strip(), format='mixed', errors='coerce')
+    valid = (
+        dates.notna()
+        & ~(amounts.isna() & df[['debit', 'credit']].notna()).any(axis=1)
+        & df[['debit', 'credit']].notna().any(axis=1)
+    )
+
+    df = pd.DataFrame({
+        'date': dates[valid].dt.strftime('%Y-%m-%d'),
+        'description': df.loc[valid, 'description'].fillna('').str.strip(),
+        'debit': amounts.loc[valid, 'debit'].fillna(0.0),
+        'credit': amounts.loc[valid, 'credit'].fillna(0.0),
+    })
+    return df.drop_duplicates(subset=CIBC_COLUMNS, keep='first').reset_index(drop=True)
+
+
+def _read_cibc_frame(raw, dtype):
+    return pd.read_csv(
+        BytesIO(raw), header=None, names=CIBC_FIELDS, index_col=False,
+        dtype=dtype, skipinitialspace=True,
+        keep_default_na=False, na_values=CIBC_NA_VALUES,
+        encoding='utf-8', encoding_errors='replace'
+    )
+
+
+def _load_cibc_csv_lines(content):
+    """Line-by-line fallback for statements pandas can't tokenize."""
+    # QUOTE_NONE keeps quotes as ordinary characters: these files are here
+    # because their quoting is broken, so split on every comma like str.split
+    reader = csv.reader(StringIO(content.strip()), quoting=csv.QUOTE_NONE)
+    raw_dates, descs, debits, credits = [], [], [], []
+    for parts in reader:
+        if len(parts) >= 3:
+            debit_text = parts[2].strip()
+            credit_text = parts[3].strip() if len(parts) > 3 else ''
+            # Same rule as the C-parser path: a row needs at least one amount
+            if not debit_text and not credit_text:
+                continue
+            try:
+                debit = float(debit_text) if debit_text else 0
+                credit = float(credit_text) if credit_text else 0
+            except:
+                continue
+            raw_dates.append(parts[0].strip())
+            descs.append(parts[1].strip())
+            debits.append(debit)
+            credits.append(credit)
+    df = pd.DataFrame({
+        'date': raw_dates,
+        'description': pd.array(descs, dtype='string[pyarrow]'),
+        'debit': np.array(debits, dtype=np.float64),
+        'credit': np.array(credits, dtype=np.float64),
+    })
+    # One vectorized date parse; 'mixed' parses each value on its own like the old per-row call
+    dates = pd.to_datetime(df['date'], format='mixed', errors='coerce')
+    df = df[dates.notna()].assign(date=dates.dropna().dt.strftime('%Y-%m-%d'))
+    return df.drop_duplicates(keep='first').reset_index(drop=True)
@@ -302,16 +302,16 @@ def update_transaction_category(
 
 def bulk_update_categories(updates: list[dict[str, Any]]) -> int:
     """Batch update categories. Each dict needs: id, cra_category, itc_pct, itc_amount."""
-    count = 0
+    params = [(u["cra_category"], u["itc_pct"], u["itc_amount"], u["id"]) for u in updates]
     with get_connection() as conn:
-        for u in updates:
-            conn.execute(
-                """UPDATE transactions
-                SET cra_category = ?, itc_pct = ?, itc_amount = ?
-                WHERE id = ?""",
-                (u["cra_category"], u["itc_pct"], u["itc_amount"], u["id"]),
-            )
-            count += 1
+        # One prepared statement for the whole batch, in a single transaction
+        conn.executemany(
+            """UPDATE transactions
+            SET cra_category = ?, itc_pct = ?, itc_amount = ?
+            WHERE id = ?""",
+            params,
+        )
+    count = len(params)
     logger.info("Bulk updated %d transaction categories", count)
     return count
 
@@ -24,6 +24,8 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+from helpers.gst_calculator import GST_FRACTION
+
 
 def _get_phone_data(phone_bill):
     """Extract phone bill totals from session state format."""
@@ -36,7 +38,7 @@ def _get_phone_data(phone_bill):
             annual = data.get('monthly', 0.0) * 12
         biz_pct = data.get('business_pct', 100)
         deductible = annual * biz_pct / 100
-        itc = deductible * 0.05 / 1.05
+        itc = deductible * GST_FRACTION
         results[person] = {
             'annual': annual,
             'business_pct': biz_pct,
@@ -86,16 +88,19 @@ def _build_expense_breakdown(df):
     if 'cra_category' not in expenses.columns:
         return {'Uncategorized': {'total': expenses['debit'].sum(), 'count': len(expenses), 'itc': 0}}
 
-    result = {}
-    for cat in expenses['cra_category'].dropna().unique():
-        cat_df = expenses[expenses['cra_category'] == cat]
-        itc = cat_df['itc_amount'].sum() if 'itc_amount' in cat_df.columns else 0
-        result[cat] = {
-            'total': cat_df['debit'].sum(),
-            'count': len(cat_df),
-            'itc': itc
+    # One grouping pass; size() counts rows straight off the category codes
+    grouped = expenses.groupby('cra_category', observed=True, sort=False)
+    totals = grouped['debit'].sum()
+    counts = grouped.size()
+    itcs = grouped['itc_amount'].sum() if 'itc_amount' in expenses.columns else None
+    return {
+        cat: {
+            'total': totals[cat],
+            'count': int(counts[cat]),
+            'itc': itcs[cat] if itcs is not None else 0
         }
-    return result
+        for cat in totals.index
+    }
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -196,11 +201,13 @@ def generate_pdf(classified_df, cash_expenses, phone_bill, fiscal_year="2024-202
     # ── 3. Cash Expenses ────────────────────────────────────────────────
     story.append(Paragraph("3. Cash Expenses (Not in Bank Statement)", styles['SectionHead']))
     cash_itc = 0
+    cash_total = 0
     if cash_expenses:
         cash_rows = []
         for e in cash_expenses:
             amt = e.get('amount', 0)
-            itc = amt * 0.05 / 1.05
+            itc = amt * GST_FRACTION
+            cash_total += amt
             cash_itc += itc
             receipt = "Yes" if e.get('has_receipt', False) else ("Recommended" if amt >= 30 else "Not required")
             cash_rows.append([
@@ -211,7 +218,7 @@ def generate_pdf(classified_df, cash_expenses, phone_bill, fiscal_year="2024-202
                 f"${itc:,.2f}",
                 receipt
             ])
-        cash_rows.append(['', '', 'TOTAL', f"${sum(e.get('amount',0) for e in cash_expenses):,.2f}",
+        cash_rows.append(['', '', 'TOTAL', f"${cash_total:,.2f}",
                           f"${cash_itc:,.2f}", ''])
         story.append(make_table(['Date', 'Description', 'Category', 'Amount', 'ITC', 'Receipt'],
                                 cash_rows, [0.9*inch, 1.5*inch, 1*inch, 0.9*inch, 0.8*inch, 0.9*inch]))
@@ -273,13 +280,14 @@ def generate_pdf(classified_df, cash_expenses, phone_bill, fiscal_year="2024-202
 
     # ── 6. Shareholder Split ────────────────────────────────────────────
     story.append(Paragraph("6. Shareholder Income Split", styles['SectionHead']))
-    net_income = rev['grand_total'] - total_exp - sum(e.get('amount', 0) for e in (cash_expenses or []))
+    total_costs = total_exp + cash_total
+    net_income = rev['grand_total'] - total_costs
     greg_share = net_income * 0.51
     lili_share = net_income * 0.49
 
     split_rows = [
         ['Total Revenue', f"${rev['grand_total']:,.2f}"],
-        ['Total Expenses (Bank + Cash)', f"${total_exp + sum(e.get('amount',0) for e in (cash_expenses or [])):,.2f}"],
+        ['Total Expenses (Bank + Cash)', f"${total_costs:,.2f}"],
         ['Net Income', f"${net_income:,.2f}"],
         ['', ''],
         ['Greg MacDonald (51%)', f"${greg_share:,.2f}"],
@@ -435,9 +443,11 @@ def generate_excel(classified_df, cash_expenses, phone_bill, fiscal_year="2024-2
     row += 1
 
     cash_itc = 0
+    cash_total = 0
     for e in (cash_expenses or []):
         amt = e.get('amount', 0)
-        itc = amt * 0.05 / 1.05
+        itc = amt * GST_FRACTION
+        cash_total += amt
         cash_itc += itc
         receipt = "Yes" if e.get('has_receipt', False) else ("Recommended" if amt >= 30 else "Not required")
         ws3.cell(row=row, column=1, value=e.get('date', 'N/A'))
@@ -450,7 +460,7 @@ def generate_excel(classified_df, cash_expenses, phone_bill, fiscal_year="2024-2
         row += 1
 
     ws3.cell(row=row, column=3, value="TOTAL").font = bold
-    ws3.cell(row=row, column=4, value=sum(e.get('amount', 0) for e in (cash_expenses or []))).number_format = currency_fmt
+    ws3.cell(row=row, column=4, value=cash_total).number_format = currency_fmt
     ws3.cell(row=row, column=4).font = bold
     ws3.cell(row=row, column=5, value=cash_itc).number_format = currency_fmt
     ws3.cell(row=row, column=5).font = bold
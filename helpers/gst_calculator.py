@@ -8,9 +8,14 @@ FIXED (Feb 2026):
 - ITC calculations verified against CRA requirements
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict
 
+GST_RATE = 0.05
+# GST portion of a GST-inclusive amount: 5% ÷ 105%
+GST_FRACTION = GST_RATE / (1 + GST_RATE)
+
 
 class GSTCalculator:
     """
@@ -24,7 +29,8 @@ class GSTCalculator:
     - Line 109: Net tax (or Line 114 for refund)
     """
     
-    GST_RATE = 0.05
+    GST_RATE = GST_RATE
+    GST_FRACTION = GST_FRACTION
     
     # Categories that represent taxable revenue (GST collected)
     TAXABLE_REVENUE_CATEGORIES = [
@@ -111,7 +117,7 @@ class GSTCalculator:
         # ===== GST COLLECTED =====
         # Revenue received from clients is GST-inclusive
         # GST = Revenue × (5% ÷ 105%) = Revenue ÷ 21
-        gst_collected = total_revenue * (self.GST_RATE / (1 + self.GST_RATE))
+        gst_collected = total_revenue * self.GST_FRACTION
         
         # ===== INPUT TAX CREDITS =====
         result = {
@@ -152,18 +158,22 @@ class GSTCalculator:
         # Only look at credits (money in)
         credits = df[df['credit'] > 0].copy()
         
+        # Each source is matched independently, so a description naming two
+        # sources counts in both. Arrow strings keep the three scans in C++
+        description = credits['description'].astype('string[pyarrow]')
+        
         # Wire transfers
-        wire_mask = credits['description'].str.contains('WIRE TSF', case=False, na=False)
+        wire_mask = description.str.contains('WIRE TSF', case=False, na=False)
         wire_total = credits.loc[wire_mask, 'credit'].sum()
         wire_count = wire_mask.sum()
         
         # Mobile deposits
-        mobile_mask = credits['description'].str.contains('MOBILE DEPOSIT', case=False, na=False)
+        mobile_mask = description.str.contains('MOBILE DEPOSIT', case=False, na=False)
         mobile_total = credits.loc[mobile_mask, 'credit'].sum()
         mobile_count = mobile_mask.sum()
         
         # Branch deposits
-        branch_mask = credits['description'].str.contains(
+        branch_mask = description.str.contains(
             'BRANCH DEPOSIT|COUNTER DEPOSIT|DEPOSIT IN BRANCH', 
             case=False, na=False, regex=True
         )
@@ -214,54 +224,54 @@ class GSTCalculator:
         
         Returns DataFrame with any problematic transactions.
         """
-        df = df.copy()
-        issues = []
-        
-        for idx, row in df.iterrows():
-            # Issue 1: ITC claimed on personal expense
-            if row['is_personal'] and row['itc_amount'] > 0:
-                issues.append({
-                    'date': row['date'],
-                    'description': row['description'],
-                    'issue': 'ITC claimed on personal expense - CRA will deny',
-                    'amount': row['itc_amount'],
-                    'severity': 'HIGH'
-                })
-            
-            # Issue 2: ITC claimed on exempt category
-            if row['cra_category'] in self.NO_ITC_CATEGORIES and row['itc_amount'] > 0:
-                issues.append({
-                    'date': row['date'],
-                    'description': row['description'],
-                    'issue': f'ITC claimed on exempt category: {row["cra_category"]}',
-                    'amount': row['itc_amount'],
-                    'severity': 'HIGH'
-                })
-            
-            # Issue 3: Meals at wrong rate (should be 50%)
-            if 'Meals' in str(row['cra_category']) and row['debit'] > 0:
-                expected_itc = row['debit'] * (self.GST_RATE / (1 + self.GST_RATE)) * 0.5
-                if abs(row['itc_amount'] - expected_itc) > 0.01:
-                    issues.append({
-                        'date': row['date'],
-                        'description': row['description'],
-                        'issue': f'Meals ITC should be 50% (${expected_itc:.2f}), claimed ${row["itc_amount"]:.2f}',
-                        'amount': row['itc_amount'] - expected_itc,
-                        'severity': 'MEDIUM'
-                    })
-            
-            # Issue 4: Large expense without review flag
-            if row['debit'] >= 500 and not row['needs_review']:
-                if row['cra_category'] in ['Equipment & Supplies', 'Vehicle Repairs & Maintenance', 'Other Expense']:
-                    issues.append({
-                        'date': row['date'],
-                        'description': row['description'],
-                        'issue': 'Large expense - verify CCA eligibility and business purpose',
-                        'amount': row['debit'],
-                        'severity': 'LOW'
-                    })
-        
-        return pd.DataFrame(issues) if issues else pd.DataFrame()
+        debit = df['debit'].to_numpy(dtype=float)
+        itc = df['itc_amount'].to_numpy(dtype=float)
+        category = df['cra_category'].astype(str)
+        claimed = itc > 0
+        
+        # Issue 1: ITC claimed on personal expense
+        personal = df['is_personal'].astype(bool).to_numpy() & claimed
+        
+        # Issue 2: ITC claimed on exempt category
+        exempt = category.isin(self.NO_ITC_CATEGORIES).to_numpy() & claimed
+        
+        # Issue 3: Meals at wrong rate (should be 50%)
+        expected_itc = debit * self.GST_FRACTION * 0.5
+        meals = (category.str.contains('Meals', regex=False).to_numpy() & (debit > 0)
+                 & (np.abs(itc - expected_itc) > 0.01))
+        
+        # Issue 4: Large expense without review flag
+        large = ((debit >= 500) & ~df['needs_review'].astype(bool).to_numpy()
+                 & category.isin(['Equipment & Supplies', 'Vehicle Repairs & Maintenance', 'Other Expense']).to_numpy())
+        
+        checks = [
+            (personal, 'ITC claimed on personal expense - CRA will deny', itc, 'HIGH'),
+            (exempt, ('ITC claimed on exempt category: ' + category[exempt]).to_numpy(), itc, 'HIGH'),
+            (meals, [f'Meals ITC should be 50% (${e:.2f}), claimed ${c:.2f}'
+                     for e, c in zip(expected_itc[meals], itc[meals])], itc - expected_itc, 'MEDIUM'),
+            (large, 'Large expense - verify CCA eligibility and business purpose', debit, 'LOW'),
+        ]
+        if not any(mask.any() for mask, *_ in checks):
+            return pd.DataFrame()
+        
+        # One frame per check, then interleave back into row order (checks in
+        # the order above within a row)
+        position = np.arange(len(df))
+        issues = pd.concat([
+            pd.DataFrame({
+                'date': df['date'].to_numpy()[mask],
+                'description': df['description'].to_numpy()[mask],
+                'issue': issue,
+                'amount': amount[mask],
+                'severity': severity,
+                '_row': position[mask],
+                '_check': check,
+            })
+            for check, (mask, issue, amount, severity) in enumerate(checks)
+            if mask.any()
+        ])
+        issues = issues.sort_values(['_row', '_check'], kind='stable')
+        return issues.drop(columns=['_row', '_check']).reset_index(drop=True).infer_objects()
     
     def get_summary_for_display(self, df: pd.DataFrame) -> Dict:
         """
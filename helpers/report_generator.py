@@ -3,12 +3,27 @@ Report Generator
 Produces CRA-compliant reports and exports
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List
 import io
 
 
+# Reasons an item is sent for review, in the order they are listed
+REVIEW_REASONS = (
+    'Large expense - verify CCA eligibility',
+    'Could not auto-classify',
+    'Flagged as potential personal expense',
+    'Mixed-use vendor - verify business purpose',
+)
+# Joined text for every combination of reasons, indexed by bit flags
+_REVIEW_REASON_TEXT = np.array([
+    '; '.join(r for bit, r in enumerate(REVIEW_REASONS) if code >> bit & 1) or 'General review'
+    for code in range(1 << len(REVIEW_REASONS))
+], dtype=object)
+
+
 class ReportGenerator:
     """
     Generates various reports for CRA filing and bookkeeping
@@ -34,7 +49,7 @@ class ReportGenerator:
         
         # Revenue
         revenue_categories = ['Revenue - Oilfield Services']
-        revenue = df[df['cra_category'].isin(revenue_categories)]['credit'].sum()
+        revenue = np.nansum(df['credit'].to_numpy(dtype=float)[df['cra_category'].isin(revenue_categories).to_numpy()])
         
         # Cost categories
         expense_categories = {
@@ -151,7 +166,7 @@ Less: ITCs (Line 108):               ${gst_summary['total_itc']:>15,.2f}
         """
         expenses = df[(df['debit'] > 0) & (df['is_personal'] == False)].copy()
         
-        summary = expenses.groupby('cra_category').agg({
+        summary = expenses.groupby('cra_category', observed=True).agg({
             'debit': ['sum', 'count'],
             'itc_amount': 'sum'
         }).reset_index()
@@ -243,20 +258,22 @@ CRA COMPLIANCE NOTES:
         """
         review_items = df[df['needs_review'] == True].copy()
         
-        # Add reason for review
-        def get_review_reason(row):
-            reasons = []
-            if row['debit'] >= 500:
-                reasons.append('Large expense - verify CCA eligibility')
-            if 'Unclassified' in str(row.get('notes', '')):
-                reasons.append('Could not auto-classify')
-            if row.get('is_personal', False):
-                reasons.append('Flagged as potential personal expense')
-            if 'WALMART' in str(row.get('description', '')).upper():
-                reasons.append('Mixed-use vendor - verify business purpose')
-            return '; '.join(reasons) if reasons else 'General review'
+        # Add reason for review: one boolean column per reason, then the
+        # combination of flags indexes a precomputed table of joined texts
+        def text_column(col):
+            if col not in review_items.columns:
+                return pd.Series('', index=review_items.index)
+            return review_items[col].astype(str)
         
-        review_items['review_reason'] = review_items.apply(get_review_reason, axis=1)
+        flags = np.column_stack([
+            (review_items['debit'] >= 500).to_numpy(dtype=bool),
+            text_column('notes').str.contains('Unclassified', regex=False, na=False).to_numpy(dtype=bool),
+            (review_items['is_personal'].astype(bool).to_numpy(dtype=bool)
+             if 'is_personal' in review_items.columns else np.zeros(len(review_items), dtype=bool)),
+            text_column('description').str.upper().str.contains('WALMART', regex=False, na=False).to_numpy(dtype=bool),
+        ])
+        codes = flags.astype(np.int64) @ (1 << np.arange(len(REVIEW_REASONS)))
+        review_items['review_reason'] = _REVIEW_REASON_TEXT[codes]
         
         return review_items[['date', 'description', 'debit', 'credit', 
                             'cra_category', 'review_reason']]
@@ -5,42 +5,51 @@ Cape Bretoner's Oilfield Services Ltd
 FIXED: Wire transfers now counted ONCE using only "WIRE TSF" keyword
 """
 
+import re
+
 import pandas as pd
 
 
+# One pass over the descriptions labels every credit with its source.
+# Alternatives are tried in order from the start of the string, so a
+# description is counted under the first source it matches (wire, then
+# mobile, then branch) rather than wherever the leftmost keyword sits.
+REVENUE_SOURCE_PATTERN = re.compile(
+    r'^(?:.*?(?P<wire>WIRE TSF)'
+    r'|.*?(?P<mobile>MOBILE DEPOSIT)'
+    r'|.*?(?P<branch>BRANCH DEPOSIT|COUNTER DEPOSIT|DEPOSIT IN BRANCH))',
+    re.IGNORECASE | re.DOTALL
+)
+
+
+def label_revenue_source(descriptions, pattern=REVENUE_SOURCE_PATTERN):
+    """Return the name of the first matching group for each description (NaN if none)."""
+    matched = descriptions.str.extract(pattern).notna()
+    return matched.idxmax(axis=1).where(matched.any(axis=1))
+
+
 def calculate_revenue(df):
     """Calculate revenue from bank transactions."""
     
-    df = df.copy()
+    credits = df[df['credit'] > 0]
     
     # WIRE TRANSFERS - Only "WIRE TSF" keyword, no customer names
-    wire_mask = (
-        (df['credit'] > 0) & 
-        df['description'].str.contains('WIRE TSF', case=False, na=False)
-    )
-    wire_df = df[wire_mask].drop_duplicates()
+    # MOBILE DEPOSITS, BRANCH/COUNTER DEPOSITS
+    tagged = credits.assign(_source=label_revenue_source(credits['description']))
+    tagged = tagged[tagged['_source'].notna()].drop_duplicates()
+    by_source = {
+        source: group.drop(columns='_source')
+        for source, group in tagged.groupby('_source')
+    }
+    empty = credits.iloc[0:0]
+    wire_df = by_source.get('wire', empty)
+    mobile_df = by_source.get('mobile', empty)
+    branch_df = by_source.get('branch', empty)
+    
     wire_total = wire_df['credit'].sum()
     wire_count = len(wire_df)
-    
-    # MOBILE DEPOSITS
-    mobile_mask = (
-        (df['credit'] > 0) & 
-        df['description'].str.contains('MOBILE DEPOSIT', case=False, na=False)
-    )
-    mobile_df = df[mobile_mask].drop_duplicates()
     mobile_total = mobile_df['credit'].sum()
     mobile_count = len(mobile_df)
-    
-    # BRANCH/COUNTER DEPOSITS
-    branch_mask = (
-        (df['credit'] > 0) & 
-        (
-            df['description'].str.contains('BRANCH DEPOSIT', case=False, na=False) |
-            df['description'].str.contains('COUNTER DEPOSIT', case=False, na=False) |
-            df['description'].str.contains('DEPOSIT IN BRANCH', case=False, na=False)
-        )
-    )
-    branch_df = df[branch_mask].drop_duplicates()
     branch_total = branch_df['credit'].sum()
     branch_count = len(branch_df)
     
@@ -6,6 +6,7 @@ Cape Bretoner's Oilfield Services Ltd.
 Greg MacDonald (51%) | Lilibeth Sejera (49%)
 """
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 
@@ -40,36 +41,31 @@ class ShareholderTracker:
         Lilibeth's e-transfers are identified by name in description.
         Unattributed transactions (ATM, etc.) default to Greg as primary operator.
         """
-        df = df.copy()
         df = df.drop_duplicates(subset=['date', 'description', 'debit', 'credit'], keep='first')
         
-        dist_df = df[df['cra_category'] == 'Shareholder Distribution']
-        personal_df = df[df['is_personal'] == True]
+        # Masked reductions straight on the column arrays, no intermediate frames
+        debit = df['debit'].to_numpy(dtype=float)
+        credit = df['credit'].to_numpy(dtype=float)
+        is_dist = (df['cra_category'] == 'Shareholder Distribution').to_numpy()
+        is_lili = df['description'].str.contains('Lilibeth|LILIBETH', case=False, na=False).to_numpy(dtype=bool)
+        dist_out = is_dist & (debit > 0)
+        dist_in = is_dist & (credit > 0)
         
-        # Lilibeth's distributions OUT
-        lili_out_mask = (
-            (dist_df['debit'] > 0) & 
-            dist_df['description'].str.contains('Lilibeth|LILIBETH', case=False, na=False)
-        )
-        self.lilibeth_withdrawals = dist_df.loc[lili_out_mask, 'debit'].sum()
-        
-        # Lilibeth's repayments IN
-        lili_in_mask = (
-            (dist_df['credit'] > 0) & 
-            dist_df['description'].str.contains('Lilibeth|LILIBETH', case=False, na=False)
-        )
-        self.lilibeth_repayments = dist_df.loc[lili_in_mask, 'credit'].sum()
+        # Lilibeth's distributions OUT and repayments IN
+        self.lilibeth_withdrawals = debit[dist_out & is_lili].sum()
+        self.lilibeth_repayments = credit[dist_in & is_lili].sum()
         
         # Greg gets everything else (ATM, unattributed, etc.)
-        total_dist_out = dist_df[dist_df['debit'] > 0]['debit'].sum()
-        total_dist_in = dist_df[dist_df['credit'] > 0]['credit'].sum()
+        total_dist_out = debit[dist_out].sum()
+        total_dist_in = credit[dist_in].sum()
         self.greg_withdrawals = total_dist_out - self.lilibeth_withdrawals
         self.greg_repayments = total_dist_in - self.lilibeth_repayments
         
         # Personal expenses — attribute to both proportionally for now
         # (Angela determines the actual split)
-        self.greg_personal = personal_df['debit'].sum() * 0.51
-        self.lilibeth_personal = personal_df['debit'].sum() * 0.49
+        total_personal = np.nansum(debit[(df['is_personal'] == True).to_numpy()])
+        self.greg_personal = total_personal * 0.51
+        self.lilibeth_personal = total_personal * 0.49
         
         # Calculate balances (negative = owes corp)
         self.greg_balance = self.greg_opening - self.greg_withdrawals - self.greg_personal + self.greg_repayments
@@ -92,7 +88,7 @@ class ShareholderTracker:
             },
             'total': {
                 'net_distributions': (total_dist_out - total_dist_in),
-                'personal_expenses': personal_df['debit'].sum(),
-                'total_activity': (total_dist_out - total_dist_in) + personal_df['debit'].sum(),
+                'personal_expenses': total_personal,
+                'total_activity': (total_dist_out - total_dist_in) + total_personal,
             }
         }
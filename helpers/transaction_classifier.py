@@ -25,10 +25,17 @@ FIXED (Feb 2026):
 - Branch deposits now recognized as revenue
 """
 
+import numpy as np
 import pandas as pd
 import re
 from typing import Dict, Tuple, Optional
 
+from helpers.gst_calculator import GST_RATE, GST_FRACTION
+
+
+# Categories whose large purchases are flagged for CCA review
+CCA_REVIEW_CATEGORIES = ('Equipment & Supplies', 'Vehicle Repairs & Maintenance')
+
 
 class TransactionClassifier:
     """
@@ -36,7 +43,8 @@ class TransactionClassifier:
     """
     
     # GST Rate
-    GST_RATE = 0.05
+    GST_RATE = GST_RATE
+    GST_FRACTION = GST_FRACTION
     
     # Category definitions with ITC eligibility
     CATEGORIES = {
@@ -67,6 +75,9 @@ class TransactionClassifier:
         'Other Expense': {'itc_eligible': True, 'itc_rate': 1.0},
     }
     
+    # Every category the classifier can emit; cra_category is stored as this categorical
+    CATEGORY_DTYPE = pd.CategoricalDtype(list(CATEGORIES))
+    
     # FIXED: Classification rules with proper regex grouping
     # Format: (pattern, category, is_personal, needs_review)
     CLASSIFICATION_RULES = [
@@ -232,19 +243,17 @@ class TransactionClassifier:
                 }
         
         # Try each classification rule
-        for pattern, category, is_personal, needs_review in self.CLASSIFICATION_RULES:
-            if re.search(pattern, description_upper, re.IGNORECASE):
-                cat_info = self.CATEGORIES.get(category, {'itc_eligible': False, 'itc_rate': 0})
-                
+        for regex, category, is_personal, needs_review, itc_rate in _RULE_TABLE:
+            if regex.search(description_upper):
                 # Calculate ITC only for business expenses (debits)
                 itc_amount = 0.0
-                if cat_info['itc_eligible'] and debit > 0 and not is_personal:
+                if itc_rate and debit > 0 and not is_personal:
                     # GST = Amount × (5% ÷ 105%) - extract GST from GST-inclusive amount
-                    gst_in_purchase = debit * (self.GST_RATE / (1 + self.GST_RATE))
-                    itc_amount = gst_in_purchase * cat_info['itc_rate']
+                    gst_in_purchase = debit * self.GST_FRACTION
+                    itc_amount = gst_in_purchase * itc_rate
                 
                 # Flag large equipment purchases for CCA review
-                if debit >= 500 and category in ['Equipment & Supplies', 'Vehicle Repairs & Maintenance']:
+                if debit >= 500 and category in CCA_REVIEW_CATEGORIES:
                     needs_review = True
                 
                 return {
@@ -269,7 +278,7 @@ class TransactionClassifier:
                 'cra_category': 'Other Expense',
                 'is_personal': False,
                 'needs_review': True,
-                'itc_amount': round(debit * (self.GST_RATE / (1 + self.GST_RATE)), 2),
+                'itc_amount': round(debit * self.GST_FRACTION, 2),
                 'notes': 'Unclassified expense - review required'
             }
     
@@ -287,30 +296,72 @@ class TransactionClassifier:
             Classified DataFrame with CRA categories and ITC amounts
         """
         df = df.copy()
-        
+
         # CRITICAL: Remove exact duplicate rows to prevent double-counting
         df = df.drop_duplicates(subset=['date', 'description', 'debit', 'credit'], keep='first')
-        
-        # Initialize classification columns
-        df['cra_category'] = ''
-        df['is_personal'] = False
-        df['needs_review'] = False
-        df['itc_amount'] = 0.0
-        df['notes'] = ''
-        
-        # Classify each transaction
-        for idx, row in df.iterrows():
-            result = self.classify_transaction(
-                row['description'],
-                row.get('debit', 0) or 0,
-                row.get('credit', 0) or 0
-            )
-            df.at[idx, 'cra_category'] = result['cra_category']
-            df.at[idx, 'is_personal'] = result['is_personal']
-            df.at[idx, 'needs_review'] = result['needs_review']
-            df.at[idx, 'itc_amount'] = result['itc_amount']
-            df.at[idx, 'notes'] = result['notes']
-        
+
+        # Vectorized equivalent of calling classify_transaction() per row:
+        # one regex scan per rule over the whole column, first match wins.
+        # Arrow-backed strings run str.upper/str.contains in Arrow's C++ kernels
+        description_upper = df['description'].astype('string[pyarrow]').fillna('').str.upper()
+        debit = df['debit'].fillna(0).to_numpy(dtype=float)
+        credit = df['credit'].fillna(0).to_numpy(dtype=float)
+
+        rule_masks = [
+            description_upper.str.contains(
+                regex.pattern, case=not regex.flags & re.IGNORECASE, regex=True
+            ).to_numpy(dtype=bool)
+            for regex in _RULE_PATTERNS
+        ]
+        matched = np.logical_or.reduce(rule_masks)
+        rule_index = np.argmax(np.vstack(rule_masks), axis=0)
+
+        category = _RULE_CATEGORY[rule_index]
+        is_personal = _RULE_PERSONAL[rule_index] & matched
+        needs_review = _RULE_REVIEW[rule_index] & matched
+        itc_rate = np.where(matched, _RULE_ITC_RATE[rule_index], 0.0)
+
+        # Calculate ITC only for business expenses (debits)
+        gst_in_purchase = debit * self.GST_FRACTION
+        itc_amount = np.where(
+            matched & (itc_rate > 0) & (debit > 0) & ~is_personal,
+            gst_in_purchase * itc_rate,
+            0.0
+        )
+
+        # Flag large equipment purchases for CCA review
+        needs_review |= matched & (debit >= 500) & np.isin(category, CCA_REVIEW_CATEGORIES)
+        notes = np.full(len(df), '', dtype=object)
+
+        # Default classification for unmatched transactions
+        unmatched_credit = ~matched & (credit > 0)
+        unmatched_debit = ~matched & ~(credit > 0)
+        category[unmatched_credit] = 'Revenue - Oilfield Services'
+        category[unmatched_debit] = 'Other Expense'
+        needs_review[~matched] = True
+        itc_amount[unmatched_debit] = gst_in_purchase[unmatched_debit]
+        notes[unmatched_credit] = 'Unclassified credit - review required'
+        notes[unmatched_debit] = 'Unclassified expense - review required'
+
+        # Special handling for GOVERNMENT CANADA (takes precedence over all rules)
+        government = description_upper.str.contains('GOVERNMENT CANADA', regex=False).to_numpy(dtype=bool)
+        category[government] = np.where(credit[government] > 0, 'GST Refund', 'Income Tax Installment')
+        notes[government] = np.where(
+            credit[government] > 0,
+            'Government credit - GST refund or carbon rebate',
+            'Tax installment'
+        )
+        is_personal[government] = False
+        needs_review[government] = False
+        itc_amount[government] = 0.0
+
+        df['cra_category'] = pd.Categorical(category, dtype=self.CATEGORY_DTYPE)
+        df['is_personal'] = is_personal
+        df['needs_review'] = needs_review
+        # round() per value (not np.round) so cents match classify_transaction exactly
+        df['itc_amount'] = [round(amount, 2) for amount in itc_amount.tolist()]
+        df['notes'] = notes
+
         # ===== POST-CLASSIFICATION OVERRIDES =====
         # Specific transactions that can't be matched by description alone
         # $147 mobile deposit on 2025-06-09 = CPO revenue for Greg (confirmed by owner)
@@ -319,11 +370,9 @@ class TransactionClassifier:
             (df['credit'] == 147.00) & 
             (df['description'].str.contains('MOBILE DEPOSIT', case=False, na=False))
         )
-        df.loc[mask_147, 'cra_category'] = 'Revenue - Oilfield Services'
-        df.loc[mask_147, 'is_personal'] = False
-        df.loc[mask_147, 'needs_review'] = False
-        df.loc[mask_147, 'itc_amount'] = 0.0
-        df.loc[mask_147, 'notes'] = 'CPO revenue - confirmed by owner'
+        df.loc[mask_147, ['cra_category', 'is_personal', 'needs_review', 'itc_amount', 'notes']] = [
+            'Revenue - Oilfield Services', False, False, 0.0, 'CPO revenue - confirmed by owner'
+        ]
         
         # $131.20 on 2025-07-03 = 1185508 Alberta Ltd — business equipment (confirmed by owner)
         mask_131 = (
@@ -331,13 +380,45 @@ class TransactionClassifier:
             (abs(df['debit'] - 131.20) < 0.01) & 
             (df['description'].str.contains('1185508 ALBERTA', case=False, na=False))
         )
-        df.loc[mask_131, 'cra_category'] = 'Equipment & Supplies'
-        df.loc[mask_131, 'needs_review'] = False
-        df.loc[mask_131, 'notes'] = 'Business equipment - confirmed by owner'
+        df.loc[mask_131, ['cra_category', 'needs_review', 'notes']] = [
+            'Equipment & Supplies', False, 'Business equipment - confirmed by owner'
+        ]
         
         return df
 
 
+def _compile_rule(pattern: str) -> re.Pattern:
+    """
+    Compile a classification rule for matching against upper-cased descriptions.
+    
+    Descriptions are upper-cased before matching, so IGNORECASE is only kept for
+    the few patterns with lower-case literals (e.g. 'Paula Gour'); dropping it
+    elsewhere makes each search roughly 3x cheaper.
+    """
+    has_lowercase = re.search(r'[a-z]', re.sub(r'\\.', '', pattern)) is not None
+    return re.compile(pattern, re.IGNORECASE if has_lowercase else 0)
+
+
+# Per-rule metadata as arrays indexed by rule position, built once at import
+# so classify_dataframe never looks up CATEGORIES per rule or per row.
+_RULE_PATTERNS = tuple(_compile_rule(rule[0]) for rule in TransactionClassifier.CLASSIFICATION_RULES)
+_RULE_CATEGORY = np.array([rule[1] for rule in TransactionClassifier.CLASSIFICATION_RULES], dtype=object)
+_RULE_PERSONAL = np.array([rule[2] for rule in TransactionClassifier.CLASSIFICATION_RULES], dtype=bool)
+_RULE_REVIEW = np.array([rule[3] for rule in TransactionClassifier.CLASSIFICATION_RULES], dtype=bool)
+_RULE_ITC_RATE = np.array([
+    TransactionClassifier.CATEGORIES.get(category, {}).get('itc_rate', 0)
+    if TransactionClassifier.CATEGORIES.get(category, {}).get('itc_eligible', False) else 0.0
+    for category in _RULE_CATEGORY
+], dtype=float)
+# The same metadata as plain Python values, one tuple per rule, for the
+# single-row classify_transaction loop
+_RULE_TABLE = tuple(
+    (regex, category, is_personal, needs_review, float(itc_rate))
+    for regex, (_, category, is_personal, needs_review), itc_rate
+    in zip(_RULE_PATTERNS, TransactionClassifier.CLASSIFICATION_RULES, _RULE_ITC_RATE)
+)
+
+
 class PersonalAccountClassifier:
     """
     Identifies potential business expenses in personal accounts
@@ -353,14 +434,14 @@ class PersonalAccountClassifier:
     def identify_business_expenses(self, df: pd.DataFrame) -> pd.DataFrame:
         """Flag potential business expenses in personal account"""
         df = df.copy()
-        df['potential_business'] = False
-        df['business_category'] = ''
-        
-        for idx, row in df.iterrows():
-            desc = row['description'].upper()
-            for pattern, category in self.BUSINESS_PATTERNS:
-                if re.search(pattern, desc, re.IGNORECASE):
-                    df.at[idx, 'potential_business'] = True
-                    df.at[idx, 'business_category'] = category
-                    break
+        description_upper = df['description'].astype('string[pyarrow]').fillna('').str.upper()
+        pattern_masks = [
+            description_upper.str.contains(pattern, case=False, regex=True).to_numpy(dtype=bool)
+            for pattern, _ in self.BUSINESS_PATTERNS
+        ]
+        # First matching pattern wins, as in the per-row loop this replaced
+        df['potential_business'] = np.logical_or.reduce(pattern_masks) if pattern_masks else False
+        df['business_category'] = np.select(
+            pattern_masks, [category for _, category in self.BUSINESS_PATTERNS], default=''
+        ).astype(object)
         return df